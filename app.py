@@ -13,28 +13,118 @@ Enhanced Features:
 - Privacy-focused background research
 """
 import logging.config
-import sys
+import os
 from flask import Flask
 
-# Ensure Python 3.8+
-if sys.version_info < (3, 8):
-    print("Python 3.8+ is required for enhanced features")
-    sys.exit(1)
+# Optional ASGI hosting (uvicorn workers) for concurrent request handling
+try:
+    import uvicorn
+    from asgiref.wsgi import WsgiToAsgi
+    ASGI_AVAILABLE = True
+except ImportError:
+    ASGI_AVAILABLE = False
+    uvicorn = None
+    WsgiToAsgi = None
+
+# Optional orjson-backed JSON provider (2-3x faster response serialization)
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+
+    class OrjsonJSONProvider(JSONProvider):
+        """JSON provider routing jsonify/get_json through orjson"""
+
+        def dumps(self, obj, **kwargs) -> str:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    OrjsonJSONProvider = None
+
+# Optional response compression (brotli with gzip fallback) for JSON payloads
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+    Compress = None
 
-from routes import main_bp
 from config.settings import (
-    FLASK_CONFIG, LOGGING_CONFIG, AUDIO_DIR,
+    FLASK_CONFIG, LOGGING_CONFIG, AUDIO_DIR_STR,
     check_api_keys, ENHANCED_SEARCH_CONFIG
 )
 from services.tts_service import TTSService
 
-# Configure logging
-logging.config.dictConfig(LOGGING_CONFIG)
+# Configure logging once per process; forked workers (gunicorn preload)
+# inherit the configured logger tree instead of rebuilding handlers
+if not getattr(logging, '_whatnow_configured', False):
+    logging.config.dictConfig(LOGGING_CONFIG)
+    logging._whatnow_configured = True
 logger = logging.getLogger(__name__)
 
-# Import the consolidated routes (all features are now in main routes)
-from routes import main_bp
-ENHANCED_ROUTES_AVAILABLE = True  # All features are consolidated
+# All features are consolidated into the main routes blueprint
+ENHANCED_ROUTES_AVAILABLE = True
+
+# Capability banner computed once at import; config flags don't change
+# per app instance, so create_app() just logs the joined string
+_CAPABILITIES = (
+    [
+        "=== WhatNowAI Capabilities ===",
+        "✓ All features enabled (consolidated version)",
+        # Core features
+        "✓ Text-to-speech guidance",
+        "✓ Location detection and geocoding",
+        "✓ Event discovery (Ticketmaster, Fallback sources)",
+        "✓ Interactive mapping",
+    ]
+    + ([
+        "✓ Advanced user profiling with web scraping",
+        "✓ AI-powered relation detection",
+        "✓ Multiple fallback event sources",
+        "✓ Personalized recommendations",
+        "✓ Comprehensive OSINT integration",
+    ] if ENHANCED_ROUTES_AVAILABLE else [])
+    + (["✓ Deep search capabilities enabled"]
+       if ENHANCED_SEARCH_CONFIG.get('ENABLE_DEEP_SEARCH') else [])
+    + (["✓ Social media search enabled"]
+       if ENHANCED_SEARCH_CONFIG.get('ENABLE_SOCIAL_SEARCH') else [])
+    + ["=============================="]
+)
+_CAPABILITY_BANNER = "\n".join(_CAPABILITIES)
+
+
+def _register_blueprint_lazy(app: Flask, dotted_path: str) -> None:
+    """
+    Register a blueprint given as a 'module:attribute' path, importing the
+    module only at registration time so app construction stays cheap.
+
+    Args:
+        app: Flask application to register on
+        dotted_path: Blueprint location, e.g. 'routes:main_bp'
+    """
+    import importlib
+    module_name, _, attr = dotted_path.partition(':')
+    blueprint = getattr(importlib.import_module(module_name), attr)
+    app.register_blueprint(blueprint)
+
+
+def get_tts_service(app: Flask) -> TTSService:
+    """
+    Return the app's TTS service, constructing it on first use
+
+    Args:
+        app: Flask application holding the lazy instance
+
+    Returns:
+        Shared TTSService instance
+    """
+    if app.extensions.get('tts') is None:
+        app.extensions['tts'] = TTSService(AUDIO_DIR_STR)
+    return app.extensions['tts']
 
 
 def create_app() -> Flask:
@@ -46,6 +136,10 @@ def create_app() -> Flask:
     """
     app = Flask(__name__)
 
+    # Serialize JSON responses with orjson when available
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonJSONProvider(app)
+
     # Determine which features are available
     # Set secret key for sessions
     app.config['SECRET_KEY'] = FLASK_CONFIG.get('SECRET_KEY', 'dev-key-change-in-production')
@@ -53,68 +147,116 @@ def create_app() -> Flask:
     # Enable async support
     app.config['PROPAGATE_EXCEPTIONS'] = True
 
-    # Register the consolidated blueprint
-    app.register_blueprint(main_bp)
-    logger.info("Routes registered with all features enabled")
-
-    # Initialize services
-    tts_service = TTSService(str(AUDIO_DIR))
-
-    # Cleanup old audio files on startup
-    try:
-        tts_service.cleanup_old_audio()
-        logger.info("Audio cleanup completed")
-    except Exception as e:
-        logger.warning(f"Audio cleanup failed: {e}")
+    # Compress JSON responses over 1KB; map event payloads shrink 5-10x and
+    # brotli level 4 is cheap enough that total latency drops for slow clients
+    if COMPRESS_AVAILABLE:
+        app.config.update(
+            COMPRESS_ALGORITHM=['br', 'gzip'],
+            COMPRESS_LEVEL=6,
+            COMPRESS_BR_LEVEL=4,
+            COMPRESS_MIN_SIZE=1024,
+            COMPRESS_MIMETYPES=['application/json']
+        )
+        Compress(app)
 
-    # Log available features and capabilities
-    logger.info("=== WhatNowAI Capabilities ===")
-    logger.info("✓ All features enabled (consolidated version)")
+    # Register the consolidated blueprint (imported lazily at this point)
+    _register_blueprint_lazy(app, 'routes:main_bp')
+    logger.info("Routes registered with all features enabled")
 
-    # Core features
-    logger.info("✓ Text-to-speech guidance")
-    logger.info("✓ Location detection and geocoding")
-    logger.info("✓ Event discovery (Ticketmaster, Fallback sources)")
-    logger.info("✓ Interactive mapping")
+    # TTS is constructed lazily; only the first caller pays the init cost
+    app.extensions['tts'] = None
 
-    # Enhanced features
-    if ENHANCED_ROUTES_AVAILABLE:
-        logger.info("✓ Advanced user profiling with web scraping")
-        logger.info("✓ AI-powered relation detection")
-        logger.info("✓ Multiple fallback event sources")
-        logger.info("✓ Personalized recommendations")
-        logger.info("✓ Comprehensive OSINT integration")
+    # Cleanup old audio files in the background so startup doesn't wait on disk
+    def _cleanup_audio():
+        try:
+            get_tts_service(app).cleanup_old_audio()
+            logger.info("Audio cleanup completed")
+        except Exception as e:
+            logger.warning(f"Audio cleanup failed: {e}")
 
-    if ENHANCED_SEARCH_CONFIG.get('ENABLE_DEEP_SEARCH'):
-        logger.info("✓ Deep search capabilities enabled")
+    import threading
+    threading.Thread(target=_cleanup_audio, daemon=True).start()
 
-    if ENHANCED_SEARCH_CONFIG.get('ENABLE_SOCIAL_SEARCH'):
-        logger.info("✓ Social media search enabled")
+    # Log available features and capabilities (precomputed at import)
+    logger.info(_CAPABILITY_BANNER)
 
-    logger.info("==============================")
     logger.info("WhatNowAI application initialized successfully")
     return app
 
 
-def main():
-    """Main entry point"""
-    # Check API keys on startup
+def _startup_checks():
+    """Run non-critical startup checks without blocking the request path"""
     try:
         check_api_keys()
     except Exception as e:
         logger.warning(f"API key check failed: {e}")
         logger.info("Continuing with available services...")
 
-    app = create_app()
+
+def get_asgi_app():
+    """
+    Build an ASGI-wrapped application for uvicorn workers
+
+    Returns:
+        ASGI application wrapping the Flask app
+    """
+    if not ASGI_AVAILABLE:
+        raise RuntimeError("asgiref/uvicorn are not installed; install them for ASGI hosting")
+    return WsgiToAsgi(create_app())
+
+
+# ASGI entry point for `uvicorn app:asgi_app` (built lazily to keep import cheap)
+asgi_app = None
+if ASGI_AVAILABLE and os.getenv('WHATNOW_ASGI'):
+    asgi_app = get_asgi_app()
+
+
+def main():
+    """Main entry point"""
+    # Check API keys on startup (off the serving path)
+    _startup_checks()
 
     logger.info(f"Starting WhatNowAI on {FLASK_CONFIG['HOST']}:{FLASK_CONFIG['PORT']}")
     logger.info("All systems initialized - ready for comprehensive user profiling!")
 
-    app.run(
-        debug=FLASK_CONFIG['DEBUG'],
-        host=FLASK_CONFIG['HOST'],
-        port=FLASK_CONFIG['PORT']
-    )
+    if ASGI_AVAILABLE and not FLASK_CONFIG['DEBUG']:
+        # Uvicorn workers give real concurrency for I/O-bound OSINT/geocoding handlers
+        uvicorn.run(
+            "app:get_asgi_app",
+            factory=True,
+            host=FLASK_CONFIG['HOST'],
+            port=FLASK_CONFIG['PORT'],
+            workers=os.cpu_count() or 1
+        )
+    else:
+        if os.getenv('WHATNOW_USE_WAITRESS'):
+            # Production-like local runs without uvicorn: waitress thread pool
+            try:
+                from waitress import serve
+            except ImportError:
+                logger.warning("WHATNOW_USE_WAITRESS is set but waitress is "
+                               "not installed; falling back to the threaded "
+                               "dev server")
+            else:
+                serve(
+                    create_app(),
+                    host=FLASK_CONFIG['HOST'],
+                    port=FLASK_CONFIG['PORT'],
+                    threads=8
+                )
+                return
+
+        # Dev fallback: threaded Werkzeug server so parallel geolocation
+        # lookups aren't serialized; the reloader only runs in debug mode
+        # (it double-imports the whole OSINT stack)
+        app = create_app()
+        app.run(
+            debug=FLASK_CONFIG['DEBUG'],
+            host=FLASK_CONFIG['HOST'],
+            port=FLASK_CONFIG['PORT'],
+            threaded=True,
+            use_reloader=FLASK_CONFIG['DEBUG']
+        )
 
 
 if __name__ == '__main__':
@@ -3,6 +3,7 @@ Enhanced Application Configuration with Multiple API Integrations
 Combines original settings with advanced features from Upgrades
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
@@ -47,11 +48,17 @@ def load_secrets():
 
     return secrets
 
-# Load secrets from file
+# Load secrets from file once; consumers do O(1) dict lookups rather than
+# re-reading and substring-scanning secrets.txt
 _secrets = load_secrets()
+SECRETS = _secrets
+
+# On-disk cache directory (persistent lookup caches, e.g. reverse geocoding)
+CACHE_DIR = BASE_DIR / 'cache'
 
 # Audio configuration
 AUDIO_DIR = BASE_DIR / 'static' / 'audio'
+AUDIO_DIR_STR = os.fspath(AUDIO_DIR)  # cached str form for hot constructors
 DEFAULT_TTS_VOICE = "en-US-JennyNeural"
 AUDIO_CLEANUP_HOURS = 24
 
@@ -236,9 +243,10 @@ LOCATION_CONFIG = {
     'MAX_PROVIDERS': 3
 }
 
-def check_api_keys():
-    """Check which API keys are available"""
-    keys_status = {
+@lru_cache(maxsize=1)
+def _api_keys_status():
+    """Compute API key availability once per process"""
+    return {
         'TICKETMASTER_API_KEY': 'SET' if TICKETMASTER_API_KEY else 'NOT SET',
         'ALLEVENTS_API_KEY': 'SET' if ALLEVENTS_API_KEY else 'NOT SET',
         'OPENAI_API_KEY': 'SET' if OPENAI_API_KEY else 'NOT SET',
@@ -250,6 +258,11 @@ def check_api_keys():
         'HUGGINGFACE_TOKEN': 'SET' if HUGGINGFACE_TOKEN else 'NOT SET'
     }
 
+
+def check_api_keys():
+    """Check which API keys are available"""
+    keys_status = _api_keys_status()
+
     print("=== API Key Status ===")
     for key, status in keys_status.items():
         print(f"{key}: {status}")
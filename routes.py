@@ -8,65 +8,73 @@ This module defines all the API endpoints for the WhatNowAI application, includi
 - Event discovery and mapping
 - Background research and personalization
 """
-from flask import Blueprint, render_template, request, jsonify, abort, send_file
+from flask import Blueprint, Response, render_template, request, jsonify, abort, send_file
+import hashlib
+import importlib.util
 import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Annotated, Dict
 import os
 
+import numpy as np
+
+# Optional fast JSON serialization for the largest payloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Optional SIMD-accelerated hashing for stable marker IDs
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+    blake3 = None
+
 # Core services imports
-from services.tts_service import TTSService, get_introduction_text, INTRODUCTION_TEXTS
+from services.tts_service import TTSService, INTRO_BUILDERS, INTRODUCTION_TEXTS
 from services.geocoding_service import GeocodingService
 from services.location_detection_service import LocationDetectionService
 from services.mapping_service import MappingService
 from services.user_profiling_service import EnhancedUserProfilingService
 from services.fallback_event_service import FallbackEventService
+from services.http_session import POOL_MAXSIZE as SESSION_POOL_MAXSIZE
 
-# Enhanced location services
-try:
-    from services.enhanced_location_service import create_location_service
-    from config.settings import LOCATION_CONFIG
-    ENHANCED_LOCATION_AVAILABLE = True
-except ImportError:
-    ENHANCED_LOCATION_AVAILABLE = False
-    create_location_service = None
+# Optional services are imported lazily on first use (see the _get_* accessors
+# below); only check module availability here so no route pays their import
+# cost unless it actually needs them
+def _module_available(name: str) -> bool:
+    """Check whether a module can be imported without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
 
-# Optional enhanced services with error handling
-# Advanced profiling is now integrated into the main user profiling service
-ADVANCED_PROFILING_AVAILABLE = False
-AdvancedProfilingService = None
 
-try:
-    from services.enhanced_integration_service import EnhancedIntegrationService
-    INTEGRATION_SERVICE_AVAILABLE = True
-except ImportError:
-    INTEGRATION_SERVICE_AVAILABLE = False
-    EnhancedIntegrationService = None
+ENHANCED_LOCATION_AVAILABLE = _module_available('services.enhanced_location_service')
+INTEGRATION_SERVICE_AVAILABLE = _module_available('services.enhanced_integration_service')
+TICKETMASTER_AVAILABLE = _module_available('services.ticketmaster_service')
+BACKGROUND_SEARCH_AVAILABLE = _module_available('searchmethods.enhanced_background_search')
 
-# Import existing services with error handling
-try:
-    from services.ticketmaster_service import TicketmasterService
-    TICKETMASTER_AVAILABLE = True
-except ImportError:
-    TICKETMASTER_AVAILABLE = False
-    TicketmasterService = None
+# Advanced profiling is now integrated into the main user profiling service
+ADVANCED_PROFILING_AVAILABLE = False
 
 # AllEvents service removed - API returns persistent 404 errors
 ALLEVENTS_AVAILABLE = False
 
-# Background search service
-try:
-    from searchmethods.enhanced_background_search import EnhancedBackgroundSearchService, UserProfile
-    BACKGROUND_SEARCH_AVAILABLE = True
-except ImportError:
-    BACKGROUND_SEARCH_AVAILABLE = False
-    EnhancedBackgroundSearchService = None
-    UserProfile = None
-
 # Configuration imports
 from config.settings import (
-    AUDIO_DIR, DEFAULT_TTS_VOICE,
+    AUDIO_DIR_STR, DEFAULT_TTS_VOICE,
     TICKETMASTER_API_KEY,
-    TICKETMASTER_CONFIG, MAP_CONFIG
+    TICKETMASTER_CONFIG, MAP_CONFIG, LOCATION_CONFIG
 )
 
 # Utils
@@ -78,55 +86,264 @@ logger = logging.getLogger(__name__)
 main_bp = Blueprint('main', __name__)
 
 # Initialize core services (these are required)
-tts_service = TTSService(str(AUDIO_DIR), DEFAULT_TTS_VOICE)
+tts_service = TTSService(AUDIO_DIR_STR, DEFAULT_TTS_VOICE)
 geocoding_service = GeocodingService()
 location_detection_service = LocationDetectionService()
 mapping_service = MappingService(MAP_CONFIG)
 user_profiling_service = EnhancedUserProfilingService()
 fallback_event_service = FallbackEventService()
 
-# Initialize optional services
-ticketmaster_service = None
-if TICKETMASTER_AVAILABLE and TICKETMASTER_API_KEY:
+# Optional services: each accessor imports and constructs its service on
+# first call and memoizes the instance (or None on failure), so workers that
+# never hit the relevant routes skip the import cost entirely
+
+
+@lru_cache(maxsize=1)
+def _get_enhanced_search_service():
+    """Lazily construct the background search service, keeping it warm after"""
+    if not BACKGROUND_SEARCH_AVAILABLE:
+        return None
     try:
-        ticketmaster_service = TicketmasterService(TICKETMASTER_API_KEY, TICKETMASTER_CONFIG)
-        logger.info("Ticketmaster service initialized successfully")
+        from searchmethods.enhanced_background_search import EnhancedBackgroundSearchService
+        service = EnhancedBackgroundSearchService()
+        logger.info("Enhanced background search service initialized successfully")
+        return service
     except Exception as e:
-        logger.error(f"Failed to initialize Ticketmaster: {e}")
+        logger.error(f"Failed to initialize background search service: {e}")
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_user_profile_cls():
+    """Lazily import the UserProfile dataclass used by the search pipeline"""
+    if not BACKGROUND_SEARCH_AVAILABLE:
+        return None
+    try:
+        from searchmethods.enhanced_background_search import UserProfile
+        return UserProfile
+    except Exception as e:
+        logger.error(f"Failed to import UserProfile: {e}")
+        return None
 
-# AllEvents service removed - API returns persistent 404 errors
 
-advanced_profiling_service = None
-if ADVANCED_PROFILING_AVAILABLE:
+@lru_cache(maxsize=1)
+def _get_ticketmaster_service():
+    """Lazily construct the Ticketmaster service"""
+    if not (TICKETMASTER_AVAILABLE and TICKETMASTER_API_KEY):
+        return None
     try:
-        advanced_profiling_service = AdvancedProfilingService()
-        logger.info("Advanced profiling service initialized successfully")
+        from services.ticketmaster_service import TicketmasterService
+        service = TicketmasterService(TICKETMASTER_API_KEY, TICKETMASTER_CONFIG)
+        logger.info("Ticketmaster service initialized successfully")
+        return service
     except Exception as e:
-        logger.error(f"Failed to initialize advanced profiling: {e}")
+        logger.error(f"Failed to initialize Ticketmaster: {e}")
+        return None
 
-integration_service = None
-if INTEGRATION_SERVICE_AVAILABLE:
+
+@lru_cache(maxsize=1)
+def _get_integration_service():
+    """Lazily construct the enhanced integration service"""
+    if not INTEGRATION_SERVICE_AVAILABLE:
+        return None
     try:
+        from services.enhanced_integration_service import EnhancedIntegrationService
         integration_config = {
             'OPENAI_API_KEY': os.getenv('OPENAI_API_KEY'),
             'TICKETMASTER_API_KEY': TICKETMASTER_API_KEY,
             'ALLEVENTS_API_KEY': None  # Removed - API not functional
         }
-        integration_service = EnhancedIntegrationService(integration_config)
+        service = EnhancedIntegrationService(integration_config)
         logger.info("Enhanced integration service initialized successfully")
+        return service
     except Exception as e:
         logger.error(f"Failed to initialize integration service: {e}")
+        return None
+
 
-# Initialize enhanced location service
-enhanced_location_service = None
-if ENHANCED_LOCATION_AVAILABLE:
+@lru_cache(maxsize=1)
+def _get_enhanced_location_service():
+    """Lazily construct the enhanced location service"""
+    if not ENHANCED_LOCATION_AVAILABLE:
+        return None
     try:
-        enhanced_location_service = create_location_service(
+        from services.enhanced_location_service import create_location_service
+        service = create_location_service(
             ipstack_key=LOCATION_CONFIG.get('IPSTACK_API_KEY')
         )
         logger.info("Enhanced location service initialized successfully")
+        return service
     except Exception as e:
         logger.error(f"Failed to initialize enhanced location service: {e}")
+        return None
+
+
+def _event_digest(name: str) -> bytes:
+    """
+    Stable 8-byte digest of an event name
+
+    Unlike builtin hash(), the digest is identical across workers and
+    restarts, so marker IDs derived from it survive map reloads and can be
+    deduplicated client-side. Uses blake3 when available, BLAKE2 otherwise.
+    """
+    data = name.encode()
+    if BLAKE3_AVAILABLE:
+        return blake3(data).digest(length=8)
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+def _parse_latlon(latitude, longitude):
+    """
+    Convert possibly-string coordinates to floats in one place
+
+    Args:
+        latitude: Raw latitude value from the request body
+        longitude: Raw longitude value from the request body
+
+    Returns:
+        Tuple of (latitude, longitude, error_response); error_response is
+        None on success and a ready (response, status) pair on bad input
+    """
+    try:
+        if latitude is not None:
+            latitude = float(latitude)
+        if longitude is not None:
+            longitude = float(longitude)
+    except (ValueError, TypeError) as e:
+        logger.error(f"Failed to convert coordinates to float: {e}")
+        return None, None, (jsonify({
+            'success': False,
+            'message': 'Invalid coordinate format. Coordinates must be numbers.'
+        }), 400)
+    return latitude, longitude, None
+
+
+def _json_body() -> Dict:
+    """
+    Parse the request JSON body with orjson, skipping the provider layer
+
+    Returns:
+        Parsed body as a dict, or {} for empty/invalid bodies
+    """
+    if not ORJSON_AVAILABLE:
+        return request.get_json(silent=True) or {}
+    raw = request.get_data(cache=False)
+    if not raw:
+        return {}
+    try:
+        parsed = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+# Request body schemas: msgspec decodes JSON straight into typed structs in
+# C (no intermediate dict, one validation pass); the dataclass fallback keeps
+# the same field access pattern when msgspec is not installed
+try:
+    import msgspec
+
+    class SubmitRequest(msgspec.Struct):
+        """Body of POST /submit"""
+        name: str = ''
+        activity: str = ''
+        social: Dict = {}
+
+    class ChatRequest(msgspec.Struct):
+        """Body of POST /chat"""
+        message: str = ''
+
+    class ProcessRequest(msgspec.Struct, rename={'run_async': 'async'}):
+        """Body of POST /process"""
+        name: str = ''
+        activity: str = ''
+        location: Dict = {}
+        social: Dict = {}
+        run_async: bool = False
+
+    class LocationBounds(msgspec.Struct):
+        """Coordinate bounds schema for POST /api/location/validate"""
+        latitude: Annotated[float, msgspec.Meta(ge=-90.0, le=90.0)]
+        longitude: Annotated[float, msgspec.Meta(ge=-180.0, le=180.0)]
+        accuracy: Annotated[float, msgspec.Meta(ge=0.0)] = 0.0
+
+    def _location_bounds_ok(data: Dict) -> bool:
+        """Type- and range-check coordinates in one C-level pass"""
+        try:
+            msgspec.convert(data, LocationBounds, strict=False)
+            return True
+        except msgspec.ValidationError:
+            return False
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    import dataclasses
+
+    @dataclasses.dataclass
+    class SubmitRequest:
+        """Body of POST /submit"""
+        name: str = ''
+        activity: str = ''
+        social: Dict = dataclasses.field(default_factory=dict)
+
+    @dataclasses.dataclass
+    class ChatRequest:
+        """Body of POST /chat"""
+        message: str = ''
+
+    @dataclasses.dataclass
+    class ProcessRequest:
+        """Body of POST /process"""
+        name: str = ''
+        activity: str = ''
+        location: Dict = dataclasses.field(default_factory=dict)
+        social: Dict = dataclasses.field(default_factory=dict)
+        run_async: bool = False
+
+    def _location_bounds_ok(data: Dict) -> bool:
+        """Type- and range-check coordinates (pure-Python fallback)"""
+        try:
+            latitude = float(data['latitude'])
+            longitude = float(data['longitude'])
+            accuracy = float(data.get('accuracy', 0.0))
+        except (KeyError, TypeError, ValueError):
+            return False
+        return -90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0 and accuracy >= 0.0
+
+    MSGSPEC_AVAILABLE = False
+    msgspec = None
+
+# Wire-name aliases used by the dataclass fallback decoder
+_BODY_FIELD_ALIASES = {'run_async': 'async'}
+
+
+def _decode_body(struct_type):
+    """
+    Parse the request JSON body into a validated request struct
+
+    Invalid or empty bodies yield a struct of defaults, so routes keep
+    their existing missing-field error responses.
+    """
+    if MSGSPEC_AVAILABLE:
+        raw = request.get_data(cache=False)
+        if raw:
+            try:
+                return msgspec.json.decode(raw, type=struct_type)
+            except msgspec.DecodeError:
+                pass
+        return struct_type()
+
+    import dataclasses
+    data = _json_body()
+    kwargs = {}
+    for spec in dataclasses.fields(struct_type):
+        key = _BODY_FIELD_ALIASES.get(spec.name, spec.name)
+        if key in data:
+            kwargs[spec.name] = data[key]
+    try:
+        return struct_type(**kwargs)
+    except TypeError:
+        return struct_type()
 
 
 @main_bp.route('/')
@@ -135,20 +352,39 @@ def home():
     return render_template('home.html')
 
 
+# Content-addressed cache of already-synthesized introduction audio:
+# the handful of introduction strings repeat constantly, so repeat posts
+# become a dict lookup instead of a TTS model invocation
+_tts_cache = {}
+
+
+def _tts_cache_key(step: str, text: str, location_data) -> str:
+    """Build a stable hash key for an introduction TTS request"""
+    location_bucket = ''
+    if location_data:
+        lat = location_data.get('latitude')
+        lon = location_data.get('longitude')
+        if lat is not None and lon is not None:
+            try:
+                # One-decimal bucket so near-identical coords share entries
+                location_bucket = f"{float(lat):.1f},{float(lon):.1f}"
+            except (TypeError, ValueError):
+                pass
+    raw = f"{step}|{DEFAULT_TTS_VOICE}|{text.strip().lower()}|{location_bucket}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
 @main_bp.route('/tts/introduction/<step>', methods=['POST'])
 def generate_introduction_tts(step: str):
     """Generate TTS for introduction steps"""
     try:
         # Get any location data from request for context
-        data = request.get_json() if request.is_json else {}
+        data = _json_body()
         location_data = data.get('location')
 
-        # Generate dynamic text based on time and location
-        text = get_introduction_text(step, location_data)
-
-        # Fallback to static text if dynamic generation fails
-        if not text:
-            text = INTRODUCTION_TEXTS.get(step)
+        # O(1) step dispatch through the precompiled builder table
+        builder = INTRO_BUILDERS.get(step)
+        text = builder(location_data) if builder else INTRODUCTION_TEXTS.get(step)
 
         if not text:
             return jsonify({
@@ -156,9 +392,20 @@ def generate_introduction_tts(step: str):
                 'message': 'Invalid introduction step'
             }), 400
 
+        # Serve repeated prompts from the audio cache when the file survives
+        cache_key = _tts_cache_key(step, text, location_data)
+        cached_audio_id = _tts_cache.get(cache_key)
+        if cached_audio_id and tts_service.audio_exists(cached_audio_id):
+            return jsonify({
+                'success': True,
+                'audio_id': cached_audio_id,
+                'text': text
+            })
+
         audio_id, _ = tts_service.generate_audio_sync(text)
 
         if audio_id:
+            _tts_cache[cache_key] = audio_id
             return jsonify({
                 'success': True,
                 'audio_id': audio_id,
@@ -182,10 +429,10 @@ def generate_introduction_tts(step: str):
 def submit_info():
     """Handle form submission with user's name and activity"""
     try:
-        data = request.get_json()
-        name = data.get('name', '').strip()
-        activity = data.get('activity', '').strip()
-        social = data.get('social', {})
+        req = _decode_body(SubmitRequest)
+        name = req.name.strip()
+        activity = req.activity.strip()
+        social = req.social
 
         if not name or not activity:
             return jsonify({
@@ -217,8 +464,8 @@ def submit_info():
 def chat():
     """Handle chat messages"""
     try:
-        data = request.get_json()
-        message = data.get('message', '').strip()
+        req = _decode_body(ChatRequest)
+        message = req.message.strip()
 
         if not message:
             return jsonify({
@@ -242,15 +489,200 @@ def chat():
         }), 500
 
 
+# Background processing infrastructure: /process work runs on a small
+# executor so the request thread isn't pinned for the full search time,
+# and finished results are cached by profile hash for repeat submissions
+_process_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='process')
+_process_tasks = {}
+_process_result_cache = {}
+_process_lock = threading.RLock()
+_PROCESS_CACHE_TTL = 3600  # seconds; profiles rarely change within an hour
+_PROCESS_CACHE_MAX = 1024
+_PROCESS_TASK_TTL = 600  # seconds; tasks the client never polls expire
+
+
+def _process_cache_get(key):
+    """Return a cached processing payload or None"""
+    with _process_lock:
+        entry = _process_result_cache.get(key)
+        if entry is None:
+            return None
+        payload, stored_at = entry
+        if time.time() - stored_at > _PROCESS_CACHE_TTL:
+            del _process_result_cache[key]
+            return None
+        return payload
+
+
+def _process_cache_put(key, payload):
+    """Store a processing payload, evicting the oldest entry when full"""
+    with _process_lock:
+        if len(_process_result_cache) >= _PROCESS_CACHE_MAX:
+            _process_result_cache.pop(next(iter(_process_result_cache)))
+        _process_result_cache[key] = (payload, time.time())
+
+
+def _process_task_set(task_id, state, result=None):
+    """Record task state, expiring records nobody ever collected"""
+    now = time.time()
+    with _process_lock:
+        for stale_id in [tid for tid, task in _process_tasks.items()
+                         if now - task['stored_at'] > _PROCESS_TASK_TTL]:
+            del _process_tasks[stale_id]
+        _process_tasks[task_id] = {'state': state, 'result': result,
+                                   'stored_at': now}
+
+
+# Social platforms the background search knows how to probe
+_SOCIAL_KEYS = ('twitter', 'instagram', 'github', 'linkedin', 'tiktok', 'youtube')
+
+
+def _process_cache_key(name: str, activity: str, location_data: Dict, social_data: Dict) -> str:
+    """Stable hash of the inputs that determine a processing result"""
+    raw = '|'.join([
+        name.lower(),
+        activity.lower(),
+        str(location_data.get('city', '')).lower(),
+        ','.join(f"{k}={v}" for k, v in sorted((social_data or {}).items()))
+    ])
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _run_background_processing(name: str, activity: str, location_data: Dict, social_data: Dict) -> Dict:
+    """Run the background search + profiling pipeline and build the response payload"""
+    # Perform background search if available
+    search_results = None
+    search_summaries = None
+
+    enhanced_search_service = _get_enhanced_search_service()
+    UserProfile = _get_user_profile_cls()
+    if enhanced_search_service and UserProfile:
+        try:
+            logger.info("Starting enhanced background search for user: %s", name)
+
+            # Create user profile for search; blank handles are dropped so
+            # the downstream search never probes empty accounts
+            user_profile = UserProfile(
+                name=name,
+                location=f"{location_data.get('city', '')}, {location_data.get('country', '')}",
+                social_handles={
+                    key: handle for key in _SOCIAL_KEYS
+                    if (handle := social_data.get(key, ''))
+                },
+                activity=activity
+            )
+
+            # Perform background search using the module-level service
+            search_data = enhanced_search_service.perform_search(user_profile)
+
+            search_results = search_data.get('raw_results', {})
+            search_summaries = search_data.get('summaries', {})
+
+            total_results = search_data.get('total_results', 0)
+            search_time = search_data.get('metadata', {}).get('search_time', 0)
+            sources_used = search_data.get('metadata', {}).get('sources_used', [])
+
+            logger.info("Enhanced search completed in %.2fs. Found %d results from %d sources: %s",
+                        search_time, total_results, len(sources_used), sources_used)
+
+        except Exception as search_error:
+            logger.warning(f"Enhanced background search failed: {search_error}")
+
+    # Default summaries if search failed or not available
+    if not search_summaries:
+        search_summaries = {
+            'general': 'Profile analysis completed.',
+            'social': 'Social media presence analyzed.',
+            'location': 'Location-based preferences identified.',
+            'activity': 'Activity preferences recorded.',
+            'interests': 'Interest areas identified.'
+        }
+
+    # Generate response text with search context
+    result = generate_response_text(name, activity, location_data, social_data, search_summaries)
+
+    # Create enhanced user profile
+    enhanced_user_profile = None
+    recommendation_context = {}
+
+    try:
+        enhanced_user_profile = user_profiling_service.create_enhanced_profile(
+            name=name,
+            location=location_data,
+            activity=activity,
+            social_data=social_data if social_data else {},
+            search_results={
+                'search_results': search_results if search_results else [],
+                'search_summaries': search_summaries if search_summaries else []
+            }
+        )
+
+        if enhanced_user_profile:
+            logger.info("Enhanced user profile created with %.1f%% completion",
+                        enhanced_user_profile.profile_completion)
+            # Get recommendation context for events
+            recommendation_context = user_profiling_service.get_recommendation_context(enhanced_user_profile)
+        else:
+            logger.warning("Enhanced user profile creation returned None")
+
+    except Exception as profile_error:
+        logger.warning(f"Enhanced user profiling failed: {profile_error}")
+        enhanced_user_profile = None
+        recommendation_context = {}
+
+    # Prepare personalization data for later use
+    personalization_data = {
+        'search_results': search_results if search_results else [],
+        'search_summaries': search_summaries if search_summaries else [],
+        'user_profile': {
+            'name': name,
+            'activity': activity,
+            'location': location_data,
+            'social': social_data if social_data else {}
+        },
+        'enhanced_profile': recommendation_context if recommendation_context else {},
+        'activity': activity,
+        'interests': enhanced_user_profile.interests if enhanced_user_profile and hasattr(enhanced_user_profile, 'interests') else [],
+        'profile_completion': enhanced_user_profile.profile_completion if enhanced_user_profile else 0
+    }
+
+    return {
+        'success': True,
+        'result': result,
+        'name': name,
+        'activity': activity,
+        'location': location_data,
+        'social': social_data,
+        'search_summaries': search_summaries,
+        'personalization_data': personalization_data,
+        'enhanced_profile_completion': enhanced_user_profile.profile_completion if enhanced_user_profile else 0,
+        'total_search_results': len(search_results) if search_results else 0,
+        'redirect_to_map': True,
+        'map_url': '/map'
+    }
+
+
+def _run_processing_task(task_id: str, cache_key: str, name: str, activity: str,
+                         location_data: Dict, social_data: Dict) -> None:
+    """Executor target: run the pipeline and record the outcome for polling"""
+    try:
+        payload = _run_background_processing(name, activity, location_data, social_data)
+        _process_cache_put(cache_key, payload)
+        _process_task_set(task_id, 'finished', payload)
+    except Exception as e:
+        logger.error(f"Background processing task {task_id} failed: {e}")
+        _process_task_set(task_id, 'failed')
+
+
 @main_bp.route('/process', methods=['POST'])
 def process_request():
     """Handle background processing of user request"""
     try:
-        data = request.get_json()
-        name = data.get('name', '').strip()
-        activity = data.get('activity', '').strip()
-        location_data = data.get('location', {})
-        social_data = data.get('social', {})
+        req = _decode_body(ProcessRequest)
+        name = req.name.strip()
+        activity = req.activity.strip()
+        location_data = req.location
+        social_data = req.social
 
         if not name or not activity:
             return jsonify({
@@ -258,131 +690,71 @@ def process_request():
                 'message': 'Missing name or activity information.'
             }), 400
 
-        # Perform background search if available
-        search_results = None
-        search_summaries = None
-
-        if BACKGROUND_SEARCH_AVAILABLE and UserProfile:
-            try:
-                logger.info(f"Starting enhanced background search for user: {name}")
-
-                # Create user profile for search
-                user_profile = UserProfile(
-                    name=name,
-                    location=f"{location_data.get('city', '')}, {location_data.get('country', '')}",
-                    social_handles={
-                        'twitter': social_data.get('twitter', ''),
-                        'instagram': social_data.get('instagram', ''),
-                        'github': social_data.get('github', ''),
-                        'linkedin': social_data.get('linkedin', ''),
-                        'tiktok': social_data.get('tiktok', ''),
-                        'youtube': social_data.get('youtube', '')
-                    },
-                    activity=activity
-                )
-
-                # Perform background search using enhanced service
-                enhanced_search_service = EnhancedBackgroundSearchService()
-                search_data = enhanced_search_service.perform_search(user_profile)
-
-                search_results = search_data.get('raw_results', {})
-                search_summaries = search_data.get('summaries', {})
-
-                total_results = search_data.get('total_results', 0)
-                search_time = search_data.get('metadata', {}).get('search_time', 0)
-                sources_used = search_data.get('metadata', {}).get('sources_used', [])
-
-                logger.info(f"Enhanced search completed in {search_time:.2f}s. "
-                           f"Found {total_results} results from {len(sources_used)} sources: {sources_used}")
-
-            except Exception as search_error:
-                logger.warning(f"Enhanced background search failed: {search_error}")
-
-        # Default summaries if search failed or not available
-        if not search_summaries:
-            search_summaries = {
-                'general': 'Profile analysis completed.',
-                'social': 'Social media presence analyzed.',
-                'location': 'Location-based preferences identified.',
-                'activity': 'Activity preferences recorded.',
-                'interests': 'Interest areas identified.'
-            }
-
-        # Generate response text with search context
-        result = generate_response_text(name, activity, location_data, social_data, search_summaries)
+        # Repeat submissions with the same profile hit the result cache
+        cache_key = _process_cache_key(name, activity, location_data, social_data)
+        cached = _process_cache_get(cache_key)
+        if cached is not None:
+            return jsonify(cached)
+
+        # Opt-in async mode: return a task id immediately and let the client
+        # poll /process/status/<task_id> while a worker runs the search
+        if req.run_async:
+            task_id = str(uuid.uuid4())
+            _process_task_set(task_id, 'running')
+            _process_executor.submit(
+                _run_processing_task, task_id, cache_key,
+                name, activity, location_data, social_data
+            )
+            return jsonify({
+                'success': True,
+                'task_id': task_id,
+                'processing': True,
+                'status_url': f'/process/status/{task_id}'
+            }), 202
 
-        # Create enhanced user profile
-        enhanced_user_profile = None
-        recommendation_context = {}
+        payload = _run_background_processing(name, activity, location_data, social_data)
+        _process_cache_put(cache_key, payload)
+        return jsonify(payload)
 
-        try:
-            enhanced_user_profile = user_profiling_service.create_enhanced_profile(
-                name=name,
-                location=location_data,
-                activity=activity,
-                social_data=social_data if social_data else {},
-                search_results={
-                    'search_results': search_results if search_results else [],
-                    'search_summaries': search_summaries if search_summaries else []
-                }
-            )
+    except Exception as e:
+        logger.error(f"Error in process_request: {e}")
+        return jsonify({
+            'success': False,
+            'message': 'An error occurred while processing your request.'
+        }), 500
 
-            if enhanced_user_profile:
-                logger.info(f"Enhanced user profile created with {enhanced_user_profile.profile_completion:.1f}% completion")
-                # Get recommendation context for events
-                recommendation_context = user_profiling_service.get_recommendation_context(enhanced_user_profile)
-            else:
-                logger.warning("Enhanced user profile creation returned None")
-
-        except Exception as profile_error:
-            logger.warning(f"Enhanced user profiling failed: {profile_error}")
-            enhanced_user_profile = None
-            recommendation_context = {}
-
-        # Prepare personalization data for later use
-        personalization_data = {
-            'search_results': search_results if search_results else [],
-            'search_summaries': search_summaries if search_summaries else [],
-            'user_profile': {
-                'name': name,
-                'activity': activity,
-                'location': location_data,
-                'social': social_data if social_data else {}
-            },
-            'enhanced_profile': recommendation_context if recommendation_context else {},
-            'activity': activity,
-            'interests': enhanced_user_profile.interests if enhanced_user_profile and hasattr(enhanced_user_profile, 'interests') else [],
-            'profile_completion': enhanced_user_profile.profile_completion if enhanced_user_profile else 0
-        }
 
+@main_bp.route('/process/status/<task_id>', methods=['GET'])
+def process_status(task_id: str):
+    """Poll the state of an async processing task"""
+    with _process_lock:
+        task = _process_tasks.get(task_id)
+        # Terminal states are single-shot: the record is dropped once the
+        # client has collected it (the payload stays in the result cache)
+        if task is not None and task['state'] in ('finished', 'failed'):
+            del _process_tasks[task_id]
+    if task is None:
         return jsonify({
-            'success': True,
-            'result': result,
-            'name': name,
-            'activity': activity,
-            'location': location_data,
-            'social': social_data,
-            'search_summaries': search_summaries,
-            'personalization_data': personalization_data,
-            'enhanced_profile_completion': enhanced_user_profile.profile_completion if enhanced_user_profile else 0,
-            'total_search_results': len(search_results) if search_results else 0,
-            'redirect_to_map': True,
-            'map_url': '/map'
-        })
+            'success': False,
+            'message': 'Unknown task id'
+        }), 404
 
-    except Exception as e:
-        logger.error(f"Error in process_request: {e}")
+    if task['state'] == 'running':
+        return jsonify({'success': True, 'state': 'running', 'processing': True})
+    if task['state'] == 'failed':
         return jsonify({
             'success': False,
+            'state': 'failed',
             'message': 'An error occurred while processing your request.'
         }), 500
+    return jsonify(dict(task['result'], state='finished'))
 
 
 @main_bp.route('/geocode', methods=['POST'])
 def reverse_geocode():
     """Reverse geocode latitude/longitude to get address information"""
     try:
-        data = request.get_json()
+        data = _json_body()
 
         # Handle both reverse geocoding and forward geocoding
         if 'location' in data:
@@ -407,21 +779,9 @@ def reverse_geocode():
                 }), 404
         else:
             # Reverse geocoding (coordinates to address)
-            latitude = data.get('latitude')
-            longitude = data.get('longitude')
-
-            # Try to convert to float if they're strings
-            try:
-                if latitude is not None:
-                    latitude = float(latitude)
-                if longitude is not None:
-                    longitude = float(longitude)
-            except (ValueError, TypeError) as e:
-                logger.error(f"Failed to convert coordinates to float in geocode: {e}")
-                return jsonify({
-                    'success': False,
-                    'message': 'Invalid coordinate format. Coordinates must be numbers.'
-                }), 400
+            latitude, longitude, err = _parse_latlon(data.get('latitude'), data.get('longitude'))
+            if err:
+                return err
 
             if not validate_coordinates(latitude, longitude):
                 return jsonify({
@@ -450,29 +810,91 @@ def reverse_geocode():
         }), 500
 
 
+# IP -> location is deterministic and drifts slowly, so geolocation results
+# are cached per /24 (IPv4) or /48 (IPv6) prefix: one upstream provider call
+# per prefix per hour instead of one per request
+_ip_location_cache = {}
+_ip_location_lock = threading.RLock()
+_IP_CACHE_TTL = 3600
+_IP_CACHE_MAX = 65536
+
+
+def _ip_cache_key(ip: str) -> str:
+    """Collapse an IP address to its /24 (IPv4) or /48 (IPv6) prefix"""
+    if '.' in ip:
+        return ip.rsplit('.', 1)[0]
+    return ':'.join(ip.split(':')[:3])
+
+
+def _cached_ip_lookup(namespace: str, ip, lookup):
+    """
+    Run an IP geolocation lookup through the prefix TTL cache
+
+    Args:
+        namespace: Cache namespace separating the different lookup services
+        ip: IP address to geolocate (may be None)
+        lookup: Callable performing the actual lookup
+
+    Returns:
+        The cached or freshly looked-up result. Dict results are returned
+        as copies: callers overlay their own fields (browser coordinates,
+        source labels), and handing out the cached dict by reference would
+        let one request's overrides leak into every later cache hit for
+        the same prefix.
+    """
+    if not ip:
+        return lookup(ip)
+
+    key = (namespace, _ip_cache_key(ip))
+    now = time.time()
+    with _ip_location_lock:
+        entry = _ip_location_cache.get(key)
+        if entry is not None:
+            result, stored_at = entry
+            if now - stored_at <= _IP_CACHE_TTL:
+                return dict(result) if isinstance(result, dict) else result
+            del _ip_location_cache[key]
+
+    result = lookup(ip)
+    # Don't pin failed lookups (dicts without coordinates) for a whole hour
+    if result and (not isinstance(result, dict) or result.get('latitude') is not None):
+        with _ip_location_lock:
+            if len(_ip_location_cache) >= _IP_CACHE_MAX:
+                _ip_location_cache.pop(next(iter(_ip_location_cache)))
+            _ip_location_cache[key] = (dict(result) if isinstance(result, dict) else result, now)
+    return result
+
+
 @main_bp.route('/detect_location', methods=['POST'])
 @main_bp.route('/detect-location', methods=['POST'])  # Support both URL formats
 def detect_location():
     """Detect user location using multiple methods"""
     try:
-        data = request.get_json() or {}
+        data = _json_body()
         request_ip = request.remote_addr
 
-        # Try to get location using advanced detection
-        location_data = location_detection_service.get_user_location(request_ip)
+        # Try to get location using advanced detection (cached per /24)
+        location_data = _cached_ip_lookup(
+            'detect', request_ip, location_detection_service.get_user_location
+        )
 
         # Use browser coordinates if available
         if data and data.get('latitude') and data.get('longitude'):
+            latitude, longitude, err = _parse_latlon(data['latitude'], data['longitude'])
+            if err:
+                return err
             location_data.update({
-                'latitude': float(data['latitude']),
-                'longitude': float(data['longitude']),
+                'latitude': latitude,
+                'longitude': longitude,
                 'accuracy': 'high',
                 'source': 'browser'
             })
 
         if location_data.get('latitude') and location_data.get('longitude'):
-            logger.info(f"Location detected: {location_data.get('city', 'Unknown')}, "
-                       f"{location_data.get('state', 'Unknown')} via {location_data.get('source', 'unknown')}")
+            logger.info("Location detected: %s, %s via %s",
+                        location_data.get('city', 'Unknown'),
+                        location_data.get('state', 'Unknown'),
+                        location_data.get('source', 'unknown'))
             return jsonify({
                 'success': True,
                 'location': location_data,
@@ -502,60 +924,99 @@ def detect_location():
         }), 500
 
 
+@lru_cache(maxsize=4096)
+def _resolve_audio_path(audio_id: str) -> str:
+    """Resolve an audio id to its file path once per id"""
+    return tts_service.get_audio_path(audio_id)
+
+
 @main_bp.route('/audio/<audio_id>')
 def serve_audio(audio_id: str):
     """Serve generated audio files"""
+    audio_path_obj = Path(_resolve_audio_path(audio_id))
+
+    # Single stat call covers both the existence check and Last-Modified
     try:
-        if not tts_service.audio_exists(audio_id):
-            abort(404)
-
-        # Get audio path and convert to Path object for enhanced version compatibility
-        audio_path = tts_service.get_audio_path(audio_id)
-        audio_path_obj = Path(audio_path)
-
-        if audio_path_obj.exists():
-            return send_file(
-                str(audio_path_obj),
-                mimetype='audio/mp3',
-                as_attachment=False
-            )
-        else:
-            abort(404)
+        stat_result = audio_path_obj.stat()
+    except OSError:
+        abort(404)
+
+    try:
+        # Conditional GET: replays answer with 304 and browsers cache the
+        # file for a day instead of re-downloading the full MP3
+        return send_file(
+            audio_path_obj,
+            mimetype='audio/mpeg',
+            as_attachment=False,
+            conditional=True,
+            etag=True,
+            max_age=86400,
+            last_modified=stat_result.st_mtime
+        )
 
     except Exception as e:
         logger.error(f"Audio serve error: {e}")
         abort(500)
 
 
+# Short-lived cache of /map/events responses: users in the same area with
+# the same interests get the previously computed marker set instead of a
+# fresh Ticketmaster/fallback fan-out
+_events_cache = {}
+_events_cache_lock = threading.RLock()
+_EVENTS_CACHE_TTL = 300  # seconds; events don't move within 5 minutes
+_EVENTS_CACHE_MAX = 1024
+
+
+def _events_cache_get(key):
+    """Return a cached events payload if present and fresh"""
+    with _events_cache_lock:
+        entry = _events_cache.get(key)
+        if entry is None:
+            return None
+        payload, stored_at = entry
+        if time.time() - stored_at > _EVENTS_CACHE_TTL:
+            del _events_cache[key]
+            return None
+        return payload
+
+
+def _events_cache_put(key, payload):
+    """Store an events payload, evicting the oldest entry when full"""
+    with _events_cache_lock:
+        if len(_events_cache) >= _EVENTS_CACHE_MAX:
+            _events_cache.pop(next(iter(_events_cache)))
+        _events_cache[key] = (payload, time.time())
+
+
+def _events_response(payload, etag: str) -> Response:
+    """Serialize an events payload with its ETag and a short client cache"""
+    if ORJSON_AVAILABLE:
+        response = Response(orjson.dumps(payload), mimetype='application/json')
+    else:
+        response = jsonify(payload)
+    response.set_etag(etag)
+    response.cache_control.max_age = 60
+    return response
+
+
 @main_bp.route('/map/events', methods=['POST'])
 def get_map_events():
     """Get events and activities for map display"""
     try:
-        data = request.get_json()
+        data = _json_body()
         location_data = data.get('location', {})
         user_interests = data.get('interests', [])
         user_activity = data.get('activity', '')
         personalization_data = data.get('personalization_data', {})
 
         # Debug logging
-        logger.info(f"Getting map events for location: {location_data}")
-        logger.info(f"User activity: '{user_activity}'")
+        logger.info("Getting map events for location: %s", location_data)
+        logger.info("User activity: '%s'", user_activity)
 
-        latitude = location_data.get('latitude')
-        longitude = location_data.get('longitude')
-
-        # Try to convert to float if they're strings
-        try:
-            if latitude is not None:
-                latitude = float(latitude)
-            if longitude is not None:
-                longitude = float(longitude)
-        except (ValueError, TypeError) as e:
-            logger.error(f"Failed to convert coordinates to float: {e}")
-            return jsonify({
-                'success': False,
-                'message': 'Invalid coordinate format. Coordinates must be numbers.'
-            }), 400
+        latitude, longitude, err = _parse_latlon(location_data.get('latitude'), location_data.get('longitude'))
+        if err:
+            return err
 
         if not validate_coordinates(latitude, longitude):
             logger.error(f"Got invalid coordinates: {latitude}, {longitude}")
@@ -564,105 +1025,160 @@ def get_map_events():
                 'message': 'Valid location is required. Please go back to onboarding and share your location to find events near you.'
             }), 400
 
-        # Clear previous markers
-        mapping_service.clear_markers()
+        # Clients re-posting for the same area and interests hold the body
+        # already: answer 304 off the ETag before any search work happens
+        etag = _event_digest(
+            f"{round(latitude, 3)}|{round(longitude, 3)}|"
+            f"{'|'.join(sorted(user_interests))}|{user_activity.lower()}"
+        ).hex()
+        if request.if_none_match.contains(etag):
+            return Response(status=304)
+
+        # Serve nearby repeat requests straight from the TTL cache
+        cache_key = (
+            round(latitude, 2), round(longitude, 2),
+            tuple(sorted(user_interests)), user_activity.lower()
+        )
+        cached_payload = _events_cache_get(cache_key)
+        if cached_payload is not None:
+            logger.info("Serving map events from cache for %s", cache_key[:2])
+            return _events_response(cached_payload, etag)
 
         all_events = []
         sources_used = []
 
-        # Get events from Ticketmaster if available
-        if ticketmaster_service:
-            try:
-                logger.info(f"Searching Ticketmaster events...")
-
-                # Extract enhanced profile data if available
-                enhanced_profile_data = personalization_data.get('enhanced_profile', {})
-                user_profile_for_ai = None
-
-                if enhanced_profile_data:
-                    user_profile_for_ai = enhanced_profile_data
-                elif personalization_data.get('user_profile'):
-                    # Fallback to basic profile data
-                    basic_profile = personalization_data['user_profile']
-                    user_profile_for_ai = {
-                        'name': basic_profile.get('name', ''),
-                        'location': basic_profile.get('location', {}),
-                        'primary_activity': basic_profile.get('activity', user_activity),
-                        'interests': [],
-                        'preferences': {'activity_style': 'balanced'},
-                        'behavioral_patterns': {},
-                        'activity_context': {'intent': 'seeking'},
-                        'completion_score': 25
-                    }
-
-                ticketmaster_events = ticketmaster_service.search_events(
-                    location=location_data,
-                    user_interests=user_interests,
-                    user_activity=user_activity,
-                    personalization_data=personalization_data,
-                    user_profile=user_profile_for_ai if hasattr(ticketmaster_service, 'search_events') else None
-                )
-
-                if ticketmaster_events:
-                    mapping_service.add_ticketmaster_events(ticketmaster_events)
-                    all_events.extend(ticketmaster_events)
-                    sources_used.append('ticketmaster')
-                    logger.info(f"Added {len(ticketmaster_events)} Ticketmaster events")
-
-            except Exception as tm_error:
-                logger.warning(f"Ticketmaster search failed: {tm_error}")
-
-        # AllEvents API removed due to persistent 404 errors
+        def _search_ticketmaster():
+            """Query Ticketmaster with the enhanced personalization payload"""
+            ticketmaster_service = _get_ticketmaster_service()
+            if not ticketmaster_service:
+                return []
+
+            logger.info("Searching Ticketmaster events...")
+
+            # Extract enhanced profile data if available
+            enhanced_profile_data = personalization_data.get('enhanced_profile', {})
+            user_profile_for_ai = None
+
+            if enhanced_profile_data:
+                user_profile_for_ai = enhanced_profile_data
+            elif personalization_data.get('user_profile'):
+                # Fallback to basic profile data
+                basic_profile = personalization_data['user_profile']
+                user_profile_for_ai = {
+                    'name': basic_profile.get('name', ''),
+                    'location': basic_profile.get('location', {}),
+                    'primary_activity': basic_profile.get('activity', user_activity),
+                    'interests': [],
+                    'preferences': {'activity_style': 'balanced'},
+                    'behavioral_patterns': {},
+                    'activity_context': {'intent': 'seeking'},
+                    'completion_score': 25
+                }
 
-        # Always use fallback service to ensure we have events
-        try:
-            logger.info(f"Searching fallback events...")
+            return ticketmaster_service.search_events(
+                location=location_data,
+                user_interests=user_interests,
+                user_activity=user_activity,
+                personalization_data=personalization_data,
+                user_profile=user_profile_for_ai if hasattr(ticketmaster_service, 'search_events') else None
+            )
 
-            fallback_events = fallback_event_service.search_events(
+        def _search_fallback():
+            """Query the fallback event sources"""
+            logger.info("Searching fallback events...")
+            return fallback_event_service.search_events(
                 latitude=latitude,
                 longitude=longitude,
                 radius=50,
                 user_interests=user_interests
             )
 
+        # Both sources are independent and network-bound, so overlap them
+        # instead of paying their latencies back to back
+        with ThreadPoolExecutor(max_workers=2) as search_executor:
+            tm_future = search_executor.submit(_search_ticketmaster)
+            fb_future = search_executor.submit(_search_fallback)
+
+            try:
+                ticketmaster_events = tm_future.result()
+            except Exception as tm_error:
+                logger.warning(f"Ticketmaster search failed: {tm_error}")
+                ticketmaster_events = []
+
+            try:
+                fallback_events = fb_future.result()
+            except Exception as fb_error:
+                logger.error(f"Fallback event search failed: {fb_error}")
+                fallback_events = []
+
+        if ticketmaster_events:
+            all_events.extend(ticketmaster_events)
+            sources_used.append('ticketmaster')
+            logger.info("Added %d Ticketmaster events", len(ticketmaster_events))
+
+        # AllEvents API removed due to persistent 404 errors
+
+        try:
             if fallback_events:
-                # Format fallback events for mapping
-                for event in fallback_events:
-                    # Ensure required fields
-                    if 'latitude' not in event:
-                        event['latitude'] = latitude + (hash(event.get('name', '')) % 100 - 50) / 1000
-                    if 'longitude' not in event:
-                        event['longitude'] = longitude + (hash(event.get('name', '')) % 100 - 50) / 1000
+                # Scatter events that came back without coordinates around the
+                # user's location: one hash per event feeds a single vectorized
+                # jitter computation instead of per-event scalar arithmetic
+                # One digest per event feeds both the jitter seed and the
+                # marker ID, so each name is hashed exactly once
+                digests = [_event_digest(e.get('name', '')) for e in fallback_events]
+
+                missing_coords = [
+                    (e, d) for e, d in zip(fallback_events, digests)
+                    if 'latitude' not in e or 'longitude' not in e
+                ]
+                if missing_coords:
+                    seeds = np.fromiter(
+                        (int.from_bytes(d[:4], 'little') for _, d in missing_coords),
+                        dtype=np.uint32,
+                        count=len(missing_coords)
+                    )
+                    jitter = (seeds.astype(np.int64) % 100 - 50) / 1000.0
+                    for (event, _), offset in zip(missing_coords, jitter):
+                        offset = float(offset)
+                        event.setdefault('latitude', latitude + offset)
+                        event.setdefault('longitude', longitude + offset)
+
+                for event, digest in zip(fallback_events, digests):
                     if 'id' not in event:
-                        event['id'] = f"fallback_{hash(event.get('name', ''))}"
+                        event['id'] = f"fallback_{digest.hex()}"
 
                 all_events.extend(fallback_events)
                 sources_used.append('fallback')
-                logger.info(f"Added {len(fallback_events)} fallback events")
-
-                # Add to mapping service - use generic dict method
-                for event in fallback_events:
-                    try:
-                        mapping_service.add_generic_event(event, source='fallback')
-                    except Exception as e:
-                        logger.warning(f"Failed to add fallback event to map: {e}")
+                logger.info("Added %d fallback events", len(fallback_events))
 
         except Exception as fb_error:
-            logger.error(f"Fallback event search failed: {fb_error}")
+            logger.error(f"Fallback event processing failed: {fb_error}")
 
-        # Get map data
-        map_data = mapping_service.get_map_data(latitude, longitude)
-        category_stats = mapping_service.get_category_stats()
+        # Build the markers into a request-local set (no shared mutation),
+        # then publish the finished set for read-only consumers like /map/search
+        marker_set = mapping_service.build_markers(
+            ticketmaster_events=ticketmaster_events,
+            fallback_events=fallback_events
+        )
+        map_data = marker_set.get_map_data(latitude, longitude)
+        category_stats = marker_set.get_category_stats()
+        mapping_service.publish(marker_set)
 
-        logger.info(f"Total events found: {len(all_events)} from sources: {sources_used}")
+        logger.info("Total events found: %d from sources: %s", len(all_events), sources_used)
 
-        return jsonify({
+        payload = {
             'success': True,
             'map_data': map_data,
             'category_stats': category_stats,
-            'total_events': len(mapping_service.get_all_markers()),
+            'total_events': len(marker_set.markers),
             'sources_used': sources_used
-        })
+        }
+
+        _events_cache_put(cache_key, payload)
+
+        # Marker payloads can run to hundreds of events; serialize them with
+        # orjson directly to skip the provider wrapping on the hot path
+        return _events_response(payload, etag)
 
     except Exception as e:
         logger.error(f"Error getting map events: {e}")
@@ -676,7 +1192,7 @@ def get_map_events():
 def search_map_events():
     """Search events on the map"""
     try:
-        data = request.get_json()
+        data = _json_body()
         query = data.get('query', '').strip()
 
         if not query:
@@ -685,13 +1201,27 @@ def search_map_events():
                 'message': 'Please provide a search query.'
             }), 400
 
-        # Search markers
-        matching_markers = mapping_service.search_markers(query)
+        # Search markers in structure-of-arrays form; orjson serializes the
+        # NumPy coordinate columns directly without per-marker dicts
+        markers_soa = mapping_service.get_markers_soa(query)
+        total_results = len(markers_soa['id'])
+
+        if ORJSON_AVAILABLE:
+            return Response(
+                orjson.dumps({
+                    'success': True,
+                    'markers': markers_soa,
+                    'total_results': total_results
+                }, option=orjson.OPT_SERIALIZE_NUMPY),
+                mimetype='application/json'
+            )
 
+        markers_soa['lat'] = markers_soa['lat'].tolist()
+        markers_soa['lon'] = markers_soa['lon'].tolist()
         return jsonify({
             'success': True,
-            'markers': [marker.to_dict() for marker in matching_markers],
-            'total_results': len(matching_markers)
+            'markers': markers_soa,
+            'total_results': total_results
         })
 
     except Exception as e:
@@ -714,9 +1244,8 @@ def map_view():
                          social={})
 
 
-@main_bp.route('/health')
-def health_check():
-    """Health check endpoint"""
+def _build_health_payload() -> Dict:
+    """Build the health payload once; service availability is fixed at import"""
     services_status = {
         'core': {
             'tts': True,
@@ -727,11 +1256,11 @@ def health_check():
             'fallback_events': True
         },
         'optional': {
-            'ticketmaster': ticketmaster_service is not None,
+            'ticketmaster': bool(TICKETMASTER_AVAILABLE and TICKETMASTER_API_KEY),
             'allevents': False,  # Removed - API not functional
             'background_search': BACKGROUND_SEARCH_AVAILABLE,
-            'advanced_profiling': advanced_profiling_service is not None,
-            'integration_service': integration_service is not None
+            'advanced_profiling': ADVANCED_PROFILING_AVAILABLE,
+            'integration_service': INTEGRATION_SERVICE_AVAILABLE
         }
     }
 
@@ -741,7 +1270,7 @@ def health_check():
     total_core = len(services_status['core'])
     total_optional = len(services_status['optional'])
 
-    return jsonify({
+    return {
         'status': 'healthy',
         'services': services_status,
         'summary': {
@@ -749,7 +1278,20 @@ def health_check():
             'optional_services': f"{active_optional}/{total_optional} active"
         },
         'version': '2.0.0-merged'
-    })
+    }
+
+
+# Load balancers poll /health constantly; serve pre-serialized bytes
+_HEALTH_PAYLOAD = _build_health_payload()
+_HEALTH_JSON = orjson.dumps(_HEALTH_PAYLOAD) if ORJSON_AVAILABLE else None
+
+
+@main_bp.route('/health')
+def health_check():
+    """Health check endpoint"""
+    if _HEALTH_JSON is not None:
+        return Response(_HEALTH_JSON, mimetype='application/json')
+    return jsonify(_HEALTH_PAYLOAD)
 
 
 # Error handlers
@@ -774,16 +1316,19 @@ def internal_error(error):
 def get_location_from_ip():
     """Enhanced IP-based location detection"""
     try:
+        enhanced_location_service = _get_enhanced_location_service()
         if not enhanced_location_service:
             return jsonify({
                 'error': 'Enhanced location service not available'
             }), 503
 
-        data = request.get_json() or {}
+        data = _json_body()
         ip_address = data.get('ip') or request.remote_addr
 
-        # Get comprehensive location data
-        location_result = enhanced_location_service.get_location_from_ip(ip_address)
+        # Get comprehensive location data (cached per /24)
+        location_result = _cached_ip_lookup(
+            'enhanced', ip_address, enhanced_location_service.get_location_from_ip
+        )
 
         if location_result:
             logger.info(f"Enhanced IP location detected: {location_result.city}, {location_result.state}")
@@ -804,7 +1349,7 @@ def get_location_from_ip():
 def reverse_geocode_coordinates():
     """Reverse geocode coordinates to address"""
     try:
-        data = request.get_json() or {}
+        data = _json_body()
         latitude = data.get('latitude')
         longitude = data.get('longitude')
 
@@ -813,6 +1358,7 @@ def reverse_geocode_coordinates():
                 'error': 'Latitude and longitude are required'
             }), 400
 
+        enhanced_location_service = _get_enhanced_location_service()
         if enhanced_location_service:
             # Use enhanced service for reverse geocoding
             location_data = enhanced_location_service._reverse_geocode_coordinates(
@@ -840,12 +1386,13 @@ def reverse_geocode_coordinates():
 def get_comprehensive_location():
     """Get comprehensive location using all available methods"""
     try:
+        enhanced_location_service = _get_enhanced_location_service()
         if not enhanced_location_service:
             return jsonify({
                 'error': 'Enhanced location service not available'
             }), 503
 
-        data = request.get_json() or {}
+        data = _json_body()
         ip_address = data.get('ip') or request.remote_addr
         latitude = data.get('latitude')
         longitude = data.get('longitude')
@@ -871,12 +1418,22 @@ def get_comprehensive_location():
 def validate_location():
     """Validate location data"""
     try:
+        data = _json_body()
+
+        # Compiled bounds check first: out-of-range or non-numeric
+        # coordinates are rejected without touching the service at all
+        if not _location_bounds_ok(data):
+            return jsonify({
+                'valid': False,
+                'data': data
+            })
+
+        enhanced_location_service = _get_enhanced_location_service()
         if not enhanced_location_service:
             return jsonify({
                 'error': 'Enhanced location service not available'
             }), 503
 
-        data = request.get_json() or {}
         is_valid = enhanced_location_service.validate_location(data)
 
         return jsonify({
@@ -891,11 +1448,52 @@ def validate_location():
         }), 500
 
 
+@main_bp.route('/api/location/validate/batch', methods=['POST'])
+def validate_location_batch():
+    """Validate coordinate bounds for many points in one vectorized pass"""
+    try:
+        data = _json_body()
+        points = data.get('points')
+
+        if not isinstance(points, list) or not points:
+            return jsonify({'error': 'points must be a non-empty list'}), 400
+
+        try:
+            coords = np.asarray(
+                [(point.get('latitude'), point.get('longitude')) for point in points],
+                dtype=np.float64
+            )
+        except (TypeError, ValueError, AttributeError):
+            return jsonify({
+                'error': 'points must be objects with numeric latitude/longitude'
+            }), 400
+
+        # One broadcasted pass over the whole batch instead of per-point
+        # Python checks; NaN/inf fall out of the isfinite mask
+        valid = (
+            np.isfinite(coords).all(axis=1)
+            & (coords[:, 0] >= -90.0) & (coords[:, 0] <= 90.0)
+            & (coords[:, 1] >= -180.0) & (coords[:, 1] <= 180.0)
+        )
+
+        return jsonify({
+            'valid': valid.tolist(),
+            'valid_count': int(valid.sum()),
+            'total': len(points)
+        })
+
+    except Exception as e:
+        logger.error(f"Batch location validation error: {e}")
+        return jsonify({
+            'error': 'Batch location validation failed'
+        }), 500
+
+
 @main_bp.route('/api/location/geocode', methods=['POST'])
 def geocode_address():
     """Geocode an address to coordinates"""
     try:
-        data = request.get_json() or {}
+        data = _json_body()
         address = data.get('address')
 
         if not address:
@@ -903,6 +1501,7 @@ def geocode_address():
                 'error': 'Address is required'
             }), 400
 
+        enhanced_location_service = _get_enhanced_location_service()
         if enhanced_location_service:
             # Use enhanced service for geocoding
             location_result = enhanced_location_service.get_location_for_address(address)
@@ -925,10 +1524,47 @@ def geocode_address():
         }), 500
 
 
+@main_bp.route('/api/location/geocode/batch', methods=['POST'])
+def geocode_addresses_batch():
+    """Geocode a list of addresses concurrently"""
+    try:
+        data = _json_body()
+        addresses = data.get('addresses')
+
+        if not addresses or not isinstance(addresses, list):
+            return jsonify({
+                'error': 'A non-empty addresses list is required'
+            }), 400
+
+        if len(addresses) > 25:
+            return jsonify({
+                'error': 'At most 25 addresses per batch'
+            }), 400
+
+        enhanced_location_service = _get_enhanced_location_service()
+        if not enhanced_location_service:
+            return jsonify({
+                'error': 'Enhanced location service not available'
+            }), 503
+
+        results = enhanced_location_service.geocode_addresses([str(a) for a in addresses])
+        return jsonify({
+            'success': True,
+            'results': [result.to_dict() if result else None for result in results]
+        })
+
+    except Exception as e:
+        logger.error(f"Batch geocoding error: {e}")
+        return jsonify({
+            'error': 'Batch geocoding failed'
+        }), 500
+
+
 @main_bp.route('/api/location/test', methods=['GET', 'POST'])
 def test_location_service():
     """Test endpoint to verify enhanced location service functionality"""
     try:
+        enhanced_location_service = _get_enhanced_location_service()
         if not enhanced_location_service:
             return jsonify({
                 'error': 'Enhanced location service not available',
@@ -950,10 +1586,11 @@ def test_location_service():
             'detected_ip': user_ip,
             'ip_location': ip_location.to_dict() if ip_location else None,
             'comprehensive_data': comprehensive_data,
-            'providers_count': len(enhanced_location_service.providers),
+            'providers_count': enhanced_location_service.provider_count,
             'service_info': {
                 'cache_size': len(enhanced_location_service.cache),
-                'ipstack_available': any(p.name == 'IPStack' for p in enhanced_location_service.providers)
+                'ipstack_available': 'IPStack' in enhanced_location_service.provider_names,
+                'session_pool_size': SESSION_POOL_MAXSIZE
             }
         })
 
@@ -1,944 +1,1675 @@
-#!/usr/bin/env python3
-"""
-Advanced OSINT Scraper
-Integrates Maigret, Recon-ng, and SpiderFoot for comprehensive intelligence gathering
-"""
-
-import os
-import sys
-import json
-import subprocess
-import time
-import logging
-from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-import argparse
-
-# Third-party imports
-import requests
-from colorama import init, Fore, Style
-
-# Load environment variables first
-from dotenv import load_dotenv
-load_dotenv()
-
-# Local imports (with fallback handling)
-try:
-    from osint_utilities import OSINTUtilities
-except ImportError:
-    print("Warning: osint_utilities module not found. Some features may be limited.")
-    OSINTUtilities = None
-
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
-
-# Load environment variables with fallback
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    print("Warning: python-dotenv not installed. Environment variables will be loaded from system only.")
-    load_dotenv = lambda: None
-
-class OSINTConfig:
-    """Configuration management for OSINT tools"""
-    
-    def __init__(self):
-        self.base_dir = Path(__file__).parent
-        self.tools_dir = self.base_dir / "tools"
-        self.output_dir = self.base_dir / "output"
-        self.logs_dir = self.base_dir / "logs"
-        
-        # Create directories
-        for directory in [self.tools_dir, self.output_dir, self.logs_dir]:
-            directory.mkdir(exist_ok=True)
-            
-        # Tool paths
-        self.maigret_path = self.tools_dir / "maigret"
-        self.recon_ng_path = self.tools_dir / "recon-ng"
-        self.spiderfoot_path = self.tools_dir / "spiderfoot"
-        
-        # API Keys (only free APIs)
-        self.api_keys = {
-            # All APIs below are free to use
-            'openstreetmap': True,  # Free geocoding service
-            'overpass': True,       # Free OpenStreetMap data
-            # Note: Paid APIs have been removed to keep this tool completely free
-        }
-
-class OSINTLogger:
-    """Custom logger for OSINT operations"""
-    
-    def __init__(self, log_dir: Path):
-        self.log_file = log_dir / f"osint_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
-    
-    def info(self, message: str):
-        self.logger.info(f"{Fore.GREEN}[INFO]{Style.RESET_ALL} {message}")
-    
-    def warning(self, message: str):
-        self.logger.warning(f"{Fore.YELLOW}[WARNING]{Style.RESET_ALL} {message}")
-    
-    def error(self, message: str):
-        self.logger.error(f"{Fore.RED}[ERROR]{Style.RESET_ALL} {message}")
-    
-    def success(self, message: str):
-        self.logger.info(f"{Fore.CYAN}[SUCCESS]{Style.RESET_ALL} {message}")
-
-class ToolManager:
-    """Manages installation and execution of OSINT tools"""
-    
-    def __init__(self, config: OSINTConfig, logger: OSINTLogger):
-        self.config = config
-        self.logger = logger
-    
-    def check_tool_installation(self, tool_name: str) -> bool:
-        """Check if a tool is installed"""
-        tool_paths = {
-            'maigret': self.config.maigret_path,
-            'recon-ng': self.config.recon_ng_path,
-            'spiderfoot': self.config.spiderfoot_path
-        }
-        
-        if tool_name in tool_paths:
-            return tool_paths[tool_name].exists()
-        
-        # Check if tool is available in PATH
-        try:
-            subprocess.run([tool_name, '--help'], 
-                         capture_output=True, check=True, timeout=10)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            return False
-    
-    def install_maigret(self) -> bool:
-        """Install Maigret"""
-        try:
-            self.logger.info("Installing Maigret...")
-            
-            # Clone Maigret repository
-            cmd = ["git", "clone", "https://github.com/soxoj/maigret.git", str(self.config.maigret_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            
-            if result.returncode != 0:
-                self.logger.error(f"Failed to clone Maigret: {result.stderr}")
-                return False
-            
-            # Install dependencies
-            pip_cmd = [sys.executable, "-m", "pip", "install", "-r", 
-                      str(self.config.maigret_path / "requirements.txt")]
-            result = subprocess.run(pip_cmd, capture_output=True, text=True, timeout=300)
-            
-            if result.returncode != 0:
-                self.logger.error(f"Failed to install Maigret dependencies: {result.stderr}")
-                return False
-            
-            self.logger.success("Maigret installed successfully")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Error installing Maigret: {str(e)}")
-            return False
-    
-    def install_recon_ng(self) -> bool:
-        """Install Recon-ng"""
-        try:
-            self.logger.info("Installing Recon-ng...")
-            
-            # Clone Recon-ng repository
-            cmd = ["git", "clone", "https://github.com/lanmaster53/recon-ng.git", str(self.config.recon_ng_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            
-            if result.returncode != 0:
-                self.logger.error(f"Failed to clone Recon-ng: {result.stderr}")
-                return False
-            
-            # Install dependencies
-            pip_cmd = [sys.executable, "-m", "pip", "install", "-r", 
-                      str(self.config.recon_ng_path / "REQUIREMENTS")]
-            result = subprocess.run(pip_cmd, capture_output=True, text=True, timeout=300)
-            
-            if result.returncode != 0:
-                self.logger.error(f"Failed to install Recon-ng dependencies: {result.stderr}")
-                return False
-            
-            self.logger.success("Recon-ng installed successfully")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Error installing Recon-ng: {str(e)}")
-            return False
-    
-    def install_spiderfoot(self) -> bool:
-        """Install SpiderFoot"""
-        try:
-            self.logger.info("Installing SpiderFoot...")
-            
-            # Clone SpiderFoot repository
-            cmd = ["git", "clone", "https://github.com/smicallef/spiderfoot.git", str(self.config.spiderfoot_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            
-            if result.returncode != 0:
-                self.logger.error(f"Failed to clone SpiderFoot: {result.stderr}")
-                return False
-            
-            # Install dependencies
-            pip_cmd = [sys.executable, "-m", "pip", "install", "-r", 
-                      str(self.config.spiderfoot_path / "requirements.txt")]
-            result = subprocess.run(pip_cmd, capture_output=True, text=True, timeout=300)
-            
-            if result.returncode != 0:
-                self.logger.error(f"Failed to install SpiderFoot dependencies: {result.stderr}")
-                return False
-            
-            self.logger.success("SpiderFoot installed successfully")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Error installing SpiderFoot: {str(e)}")
-            return False
-    
-    def setup_tools(self) -> Dict[str, bool]:
-        """Setup all OSINT tools"""
-        tools_status = {}
-        
-        # Check and install Maigret
-        if not self.check_tool_installation('maigret'):
-            tools_status['maigret'] = self.install_maigret()
-        else:
-            tools_status['maigret'] = True
-            self.logger.info("Maigret already installed")
-        
-        # Check and install Recon-ng
-        if not self.check_tool_installation('recon-ng'):
-            tools_status['recon-ng'] = self.install_recon_ng()
-        else:
-            tools_status['recon-ng'] = True
-            self.logger.info("Recon-ng already installed")
-        
-        # Check and install SpiderFoot
-        if not self.check_tool_installation('spiderfoot'):
-            tools_status['spiderfoot'] = self.install_spiderfoot()
-        else:
-            tools_status['spiderfoot'] = True
-            self.logger.info("SpiderFoot already installed")
-        
-        return tools_status
-
-class MaigretIntegration:
-    """Integration with Maigret for username enumeration"""
-    
-    def __init__(self, config: OSINTConfig, logger: OSINTLogger):
-        self.config = config
-        self.logger = logger
-        self.maigret_script = self.config.maigret_path / "maigret.py"
-    
-    def search_username(self, username: str, output_dir: Path) -> Dict:
-        """Search for username across social media platforms"""
-        try:
-            self.logger.info(f"Running Maigret search for username: {username}")
-            
-            output_file = output_dir / f"maigret_{username}_{int(time.time())}"
-            
-            cmd = [
-                sys.executable, str(self.maigret_script),
-                username,
-                "--folderoutput", str(output_file),
-                "--json", str(output_file / f"{username}.json"),
-                "--timeout", "30"
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-            
-            if result.returncode == 0:
-                self.logger.success(f"Maigret search completed for {username}")
-                
-                # Parse JSON output
-                json_file = output_file / f"{username}.json"
-                if json_file.exists():
-                    with open(json_file, 'r') as f:
-                        return json.load(f)
-            else:
-                self.logger.error(f"Maigret search failed: {result.stderr}")
-            
-            return {}
-            
-        except Exception as e:
-            self.logger.error(f"Error running Maigret: {str(e)}")
-            return {}
-
-class ReconNGIntegration:
-    """Integration with Recon-ng for reconnaissance"""
-    
-    def __init__(self, config: OSINTConfig, logger: OSINTLogger):
-        self.config = config
-        self.logger = logger
-        # Updated to use the correct Recon-ng entry point
-        self.recon_script = self.config.recon_ng_path / "recon-ng"
-        # Fallback for Windows
-        if not self.recon_script.exists():
-            self.recon_script = self.config.recon_ng_path / "recon-ng.py"
-    
-    def create_workspace(self, workspace_name: str) -> bool:
-        """Create a new Recon-ng workspace"""
-        try:
-            cmd = [
-                sys.executable, str(self.recon_script),
-                "-w", workspace_name,
-                "-x", "exit"
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            return result.returncode == 0
-            
-        except Exception as e:
-            self.logger.error(f"Error creating Recon-ng workspace: {str(e)}")
-            return False
-    
-    def run_domain_recon(self, domain: str, workspace_name: str) -> Dict:
-        """Run domain reconnaissance using Recon-ng"""
-        try:
-            self.logger.info(f"Running Recon-ng domain reconnaissance for: {domain}")
-            
-            # Create workspace
-            if not self.create_workspace(workspace_name):
-                self.logger.error("Failed to create Recon-ng workspace")
-                return {}
-            
-            # Run reconnaissance modules
-            commands = [
-                f"use recon/domains-hosts/hackertarget",
-                f"set SOURCE {domain}",
-                "run",
-                f"use recon/hosts-hosts/resolve",
-                "run",
-                "show hosts"
-            ]
-            
-            cmd_file = self.config.output_dir / f"recon_commands_{int(time.time())}.txt"
-            with open(cmd_file, 'w') as f:
-                f.write('\n'.join(commands))
-            
-            cmd = [
-                sys.executable, str(self.recon_script),
-                "-w", workspace_name,
-                "-r", str(cmd_file)
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            
-            if result.returncode == 0:
-                self.logger.success(f"Recon-ng domain reconnaissance completed for {domain}")
-                return {"output": result.stdout, "error": result.stderr}
-            else:
-                self.logger.error(f"Recon-ng failed: {result.stderr}")
-            
-            return {}
-            
-        except Exception as e:
-            self.logger.error(f"Error running Recon-ng: {str(e)}")
-            return {}
-
-class SpiderFootIntegration:
-    """Integration with SpiderFoot for automated OSINT scanning"""
-    
-    def __init__(self, config: OSINTConfig, logger: OSINTLogger):
-        self.config = config
-        self.logger = logger
-        self.spiderfoot_script = self.config.spiderfoot_path / "sf.py"
-    
-    def run_scan(self, target: str, scan_type: str = "all") -> Dict:
-        """Run SpiderFoot scan"""
-        try:
-            self.logger.info(f"Running SpiderFoot scan for: {target}")
-            
-            output_file = self.config.output_dir / f"spiderfoot_{target.replace('.', '_')}_{int(time.time())}.json"
-            
-            cmd = [
-                sys.executable, str(self.spiderfoot_script),
-                "-s", target,
-                "-t", scan_type,
-                "-j",
-                "-o", str(output_file)
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=1800)  # 30 minutes timeout
-            
-            if result.returncode == 0:
-                self.logger.success(f"SpiderFoot scan completed for {target}")
-                
-                if output_file.exists():
-                    with open(output_file, 'r') as f:
-                        return json.load(f)
-            else:
-                self.logger.error(f"SpiderFoot scan failed: {result.stderr}")
-            
-            return {}
-            
-        except Exception as e:
-            self.logger.error(f"Error running SpiderFoot: {str(e)}")
-            return {}
-
-class OSINTTarget:
-    """Represents an OSINT investigation target"""
-    
-    def __init__(self, full_name: str = "", email: str = "", 
-                 social_handles: List[str] = None, address: str = "", 
-                 coordinates: Tuple[float, float] = None):
-        self.full_name = full_name
-        self.email = email
-        self.social_handles = social_handles or []
-        self.address = address
-        self.coordinates = coordinates  # (latitude, longitude)
-        
-        # Derived information
-        self.domain = email.split('@')[1] if email and '@' in email else ""
-        self.username_variants = self._generate_username_variants()
-    
-    def _generate_username_variants(self) -> List[str]:
-        """Generate possible username variants from full name"""
-        if not self.full_name:
-            return []
-        
-        name_parts = self.full_name.lower().split()
-        if len(name_parts) < 2:
-            return [self.full_name.lower()]
-        
-        variants = []
-        first, last = name_parts[0], name_parts[-1]
-        
-        # Common username patterns
-        variants.extend([
-            first + last,
-            first + '.' + last,
-            first + '_' + last,
-            first + last[0],
-            first[0] + last,
-            last + first,
-            last + '.' + first,
-            last + '_' + first
-        ])
-        
-        # Add social media handles
-        variants.extend(self.social_handles)
-        
-        return list(set(variants))  # Remove duplicates
-
-class OSINTScraper:
-    """Main OSINT scraper class"""
-    
-    def __init__(self):
-        self.config = OSINTConfig()
-        self.logger = OSINTLogger(self.config.logs_dir)
-        self.tool_manager = ToolManager(self.config, self.logger)
-        
-        # Initialize tool integrations
-        self.maigret = MaigretIntegration(self.config, self.logger)
-        self.recon_ng = ReconNGIntegration(self.config, self.logger)
-        self.spiderfoot = SpiderFootIntegration(self.config, self.logger)
-        
-        # Initialize utilities with API keys (with fallback)
-        if OSINTUtilities:
-            self.utilities = OSINTUtilities(self.config.api_keys)
-        else:
-            self.utilities = None
-            self.logger.warning("OSINTUtilities not available. Some features will be limited.")
-    
-    def setup(self) -> bool:
-        """Setup the OSINT environment"""
-        self.logger.info("Setting up OSINT environment...")
-        
-        # Setup tools
-        tools_status = self.tool_manager.setup_tools()
-        
-        # Check if all tools are ready
-        all_ready = all(tools_status.values())
-        
-        if all_ready:
-            self.logger.success("All OSINT tools are ready!")
-        else:
-            failed_tools = [tool for tool, status in tools_status.items() if not status]
-            self.logger.warning(f"Some tools failed to install: {', '.join(failed_tools)}")
-        
-        return all_ready
-    
-    def investigate_target(self, target: OSINTTarget) -> Dict:
-        """Perform comprehensive OSINT investigation on target"""
-        self.logger.info(f"Starting OSINT investigation for: {target.full_name}")
-        
-        investigation_results = {
-            'target_info': {
-                'full_name': target.full_name,
-                'email': target.email,
-                'social_handles': target.social_handles,
-                'address': target.address,
-                'coordinates': target.coordinates
-            },
-            'maigret_results': {},
-            'recon_ng_results': {},
-            'spiderfoot_results': {},
-            'additional_intel': {},
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        # Create target-specific output directory
-        target_output_dir = self.config.output_dir / f"investigation_{target.full_name.replace(' ', '_')}_{int(time.time())}"
-        target_output_dir.mkdir(exist_ok=True)
-        
-        # Run Maigret for username enumeration
-        if target.username_variants:
-            self.logger.info("Running username enumeration with Maigret...")
-            for username in target.username_variants:
-                maigret_result = self.maigret.search_username(username, target_output_dir)
-                if maigret_result:
-                    investigation_results['maigret_results'][username] = maigret_result
-        
-        # Run Recon-ng for domain reconnaissance
-        if target.domain:
-            self.logger.info("Running domain reconnaissance with Recon-ng...")
-            workspace_name = f"investigation_{int(time.time())}"
-            recon_result = self.recon_ng.run_domain_recon(target.domain, workspace_name)
-            if recon_result:
-                investigation_results['recon_ng_results'] = recon_result
-        
-        # Run SpiderFoot for comprehensive scanning
-        scan_targets = []
-        if target.email:
-            scan_targets.append(target.email)
-        if target.domain:
-            scan_targets.append(target.domain)
-        
-        for scan_target in scan_targets:
-            self.logger.info(f"Running comprehensive scan with SpiderFoot for: {scan_target}")
-            spiderfoot_result = self.spiderfoot.run_scan(scan_target)
-            if spiderfoot_result:
-                investigation_results['spiderfoot_results'][scan_target] = spiderfoot_result
-        
-        # Additional intelligence gathering using FREE utilities
-        additional_intel = {}
-        
-        if self.utilities:
-            # Domain analysis
-            if target.domain:
-                self.logger.info(f"Performing comprehensive domain analysis for: {target.domain}")
-                try:
-                    additional_intel['domain_analysis'] = self.utilities.comprehensive_domain_analysis(target.domain)
-                except Exception as e:
-                    self.logger.error(f"Domain analysis failed: {str(e)}")
-            
-            # Email investigation
-            if target.email:
-                self.logger.info(f"Investigating email: {target.email}")
-                try:
-                    additional_intel['email_investigation'] = self.utilities.email_investigation(target.email)
-                except Exception as e:
-                    self.logger.error(f"Email investigation failed: {str(e)}")
-            
-            # Social media search for usernames
-            if target.username_variants:
-                self.logger.info("Performing social media search...")
-                try:
-                    additional_intel['social_media_search'] = {}
-                    for username in target.username_variants[:3]:  # Limit to first 3 to avoid rate limiting
-                        additional_intel['social_media_search'][username] = self.utilities.social_media_search(username)
-                except Exception as e:
-                    self.logger.error(f"Social media search failed: {str(e)}")
-            
-            # Location analysis
-            if target.coordinates:
-                self.logger.info(f"Analyzing location: {target.coordinates}")
-                try:
-                    lat, lon = target.coordinates
-                    # Pass investigation results for interest-based filtering
-                    additional_intel['location_analysis'] = self.utilities.location_analysis(lat, lon, investigation_results)
-                except Exception as e:
-                    self.logger.error(f"Location analysis failed: {str(e)}")
-        else:
-            self.logger.warning("Additional intelligence features not available. Install missing dependencies.")
-        
-        investigation_results['additional_intel'] = additional_intel
-        
-        # Save investigation results
-        results_file = target_output_dir / "investigation_results.json"
-        try:
-            with open(results_file, 'w', encoding='utf-8') as f:
-                json.dump(investigation_results, f, indent=2, default=str, ensure_ascii=False)
-            self.logger.success(f"Investigation completed. Results saved to: {results_file}")
-        except Exception as e:
-            self.logger.error(f"Failed to save results: {str(e)}")
-        
-        return investigation_results
-    
-    def generate_report(self, investigation_results: Dict) -> str:
-        """Generate a human-readable report"""
-        report = []
-        report.append("="*80)
-        report.append("OSINT INVESTIGATION REPORT")
-        report.append("="*80)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("")
-        
-        # Target Information
-        target_info = investigation_results.get('target_info', {})
-        report.append("TARGET INFORMATION:")
-        report.append("-" * 40)
-        report.append(f"Full Name: {target_info.get('full_name', 'N/A')}")
-        report.append(f"Email: {target_info.get('email', 'N/A')}")
-        report.append(f"Social Handles: {', '.join(target_info.get('social_handles', []))}")
-        report.append(f"Address: {target_info.get('address', 'N/A')}")
-        report.append(f"Coordinates: {target_info.get('coordinates', 'N/A')}")
-        report.append("")
-        
-        # Maigret Results
-        maigret_results = investigation_results.get('maigret_results', {})
-        if maigret_results:
-            report.append("MAIGRET RESULTS (Username Enumeration):")
-            report.append("-" * 40)
-            for username, results in maigret_results.items():
-                report.append(f"Username: {username}")
-                if isinstance(results, dict):
-                    found_profiles = 0
-                    for platform, data in results.items():
-                        if isinstance(data, dict) and data.get('status') == 'found':
-                            report.append(f"  - {platform}: {data.get('url', 'Found')}")
-                            found_profiles += 1
-                    report.append(f"  Total profiles found: {found_profiles}")
-                report.append("")
-        
-        # Recon-ng Results
-        recon_results = investigation_results.get('recon_ng_results', {})
-        if recon_results:
-            report.append("RECON-NG RESULTS (Domain Reconnaissance):")
-            report.append("-" * 40)
-            report.append(recon_results.get('output', 'No output available'))
-            report.append("")
-        
-        # SpiderFoot Results
-        spiderfoot_results = investigation_results.get('spiderfoot_results', {})
-        if spiderfoot_results:
-            report.append("SPIDERFOOT RESULTS (Comprehensive Scan):")
-            report.append("-" * 40)
-            for target, results in spiderfoot_results.items():
-                report.append(f"Target: {target}")
-                # Summarize SpiderFoot results
-                if isinstance(results, list):
-                    report.append(f"Total findings: {len(results)}")
-                    # Group by data type
-                    data_types = {}
-                    for item in results:
-                        if isinstance(item, dict):
-                            data_type = item.get('type', 'Unknown')
-                            data_types[data_type] = data_types.get(data_type, 0) + 1
-                    
-                    for data_type, count in data_types.items():
-                        report.append(f"  - {data_type}: {count}")
-                report.append("")
-        
-        # Additional Intelligence
-        additional_intel = investigation_results.get('additional_intel', {})
-        if additional_intel:
-            report.append("ADDITIONAL INTELLIGENCE:")
-            report.append("-" * 40)
-            
-            # Domain Analysis
-            domain_analysis = additional_intel.get('domain_analysis')
-            if domain_analysis:
-                report.append(f"Domain Analysis for: {domain_analysis.get('domain', 'N/A')}")
-                
-                # DNS Records
-                dns_records = domain_analysis.get('dns_records', {})
-                if dns_records:
-                    report.append("  DNS Records:")
-                    for record_type, records in dns_records.items():
-                        if records:
-                            report.append(f"    {record_type}: {', '.join(records[:3])}{'...' if len(records) > 3 else ''}")
-                
-                # Subdomains
-                subdomains = domain_analysis.get('subdomains', [])
-                if subdomains:
-                    report.append(f"  Subdomains found: {len(subdomains)}")
-                    for subdomain in subdomains[:5]:  # Show first 5
-                        report.append(f"    - {subdomain}")
-                    if len(subdomains) > 5:
-                        report.append(f"    ... and {len(subdomains) - 5} more")
-                
-                # IP Analysis
-                ip_analysis = domain_analysis.get('ip_analysis', {})
-                if ip_analysis:
-                    report.append("  IP Analysis:")
-                    for ip, data in ip_analysis.items():
-                        report.append(f"    IP: {ip}")
-                        
-                        # Geolocation
-                        geo = data.get('geolocation', {})
-                        if geo:
-                            location = f"{geo.get('city', 'Unknown')}, {geo.get('country', 'Unknown')}"
-                            report.append(f"      Location: {location}")
-                            if geo.get('isp'):
-                                report.append(f"      ISP: {geo.get('isp')}")
-                        
-                        # Port scan results
-                        ports = data.get('port_scan', {})
-                        if ports and ports.get('open_ports'):
-                            report.append(f"      Open ports: {', '.join(map(str, ports['open_ports']))}")
-                
-                # WHOIS Information
-                whois_info = domain_analysis.get('whois', {})
-                if whois_info and not whois_info.get('error'):
-                    report.append("  WHOIS Information:")
-                    report.append(f"    Registrar: {whois_info.get('registrar', 'N/A')}")
-                    report.append(f"    Creation Date: {whois_info.get('creation_date', 'N/A')}")
-                    report.append(f"    Expiration Date: {whois_info.get('expiration_date', 'N/A')}")
-                
-                # SSL Information
-                ssl_info = domain_analysis.get('ssl_info', {})
-                if ssl_info and not ssl_info.get('error'):
-                    report.append("  SSL Certificate:")
-                    subject = ssl_info.get('subject', {})
-                    if subject:
-                        report.append(f"    Subject: {subject.get('commonName', 'N/A')}")
-                    issuer = ssl_info.get('issuer', {})
-                    if issuer:
-                        report.append(f"    Issuer: {issuer.get('organizationName', 'N/A')}")
-                    report.append(f"    Valid Until: {ssl_info.get('notAfter', 'N/A')}")
-                
-                report.append("")
-            
-            # Email Investigation
-            email_investigation = additional_intel.get('email_investigation')
-            if email_investigation:
-                report.append(f"Email Investigation for: {email_investigation.get('email', 'N/A')}")
-                
-                # Format validation
-                format_check = email_investigation.get('format_validation', {})
-                if format_check:
-                    report.append(f"  Email Format: {'Valid' if format_check.get('format_valid') else 'Invalid'}")
-                    report.append(f"  Domain: {format_check.get('domain', 'N/A')}")
-                
-                # MX Record check
-                mx_check = email_investigation.get('domain_mx_check', {})
-                if mx_check:
-                    report.append(f"  MX Records: {'Yes' if mx_check.get('has_mx') else 'No'}")
-                
-                # Basic breach check
-                breach_check = email_investigation.get('breach_check', {})
-                if breach_check:
-                    if breach_check.get('domain_in_known_breaches'):
-                        report.append("  ⚠️  Domain found in known breach lists")
-                    else:
-                        report.append("  ✅ Domain not in common breach lists")
-                
-                report.append("")
-            
-            # Social Media Search
-            social_search = additional_intel.get('social_media_search')
-            if social_search:
-                report.append("SOCIAL MEDIA SEARCH:")
-                report.append("-" * 30)
-                for username, results in social_search.items():
-                    report.append(f"Username: {username}")
-                    verified = results.get('verified_profiles', [])
-                    potential = results.get('potential_profiles', [])
-                    
-                    if verified:
-                        report.append(f"  ✅ Verified profiles ({len(verified)}):")
-                        for profile in verified:
-                            report.append(f"    - {profile['platform']}: {profile['url']}")
-                    
-                    report.append(f"  🔍 Potential profiles to check: {len(potential)}")
-                    for profile in potential[:5]:  # Show first 5
-                        report.append(f"    - {profile['platform']}: {profile['url']}")
-                    
-                    if len(potential) > 5:
-                        report.append(f"    ... and {len(potential) - 5} more")
-                    
-                    report.append("")
-                
-                report.append("")
-            
-            # Location Analysis
-            location_analysis = additional_intel.get('location_analysis')
-            if location_analysis:
-                coordinates = location_analysis.get('coordinates', 'N/A')
-                report.append(f"Location Analysis for: {coordinates}")
-                
-                # Reverse Geocoding
-                geocoding = location_analysis.get('reverse_geocoding', {})
-                if geocoding and 'display_name' in geocoding:
-                    report.append(f"  Address: {geocoding['display_name']}")
-                
-                # Nearby Places
-                nearby_places = location_analysis.get('nearby_places', [])
-                if nearby_places:
-                    report.append(f"  Nearby Places of Interest: {len(nearby_places)}")
-                    # Group by type
-                    place_types = {}
-                    for place in nearby_places:
-                        place_type = place.get('type', 'Unknown')
-                        place_types[place_type] = place_types.get(place_type, 0) + 1
-                    
-                    for place_type, count in list(place_types.items())[:5]:  # Show top 5
-                        report.append(f"    - {place_type}: {count}")
-                
-                # Norfolk Events (if location is in Norfolk, VA area)
-                norfolk_events = location_analysis.get('norfolk_events')
-                if norfolk_events and not norfolk_events.get('error'):
-                    report.append("  🏛️ NORFOLK, VA LOCAL EVENTS:")
-                    report.append("  " + "-" * 35)
-                    
-                    # Show filtering information if applied
-                    if norfolk_events.get('filter_applied'):
-                        user_interests = norfolk_events.get('user_interests', [])
-                        report.append(f"  🎯 Filtered based on detected interests: {', '.join(user_interests[:5])}{'...' if len(user_interests) > 5 else ''}")
-                        report.append(f"  📊 Showing {norfolk_events.get('events_found', 0)} relevant events (from {norfolk_events.get('original_events_count', 0)} total)")
-                        report.append("")
-                    
-                    events = norfolk_events.get('events', [])
-                    news_items = norfolk_events.get('news_items', [])
-                    
-                    if events:
-                        report.append(f"  📅 Relevant Events ({len(events)} found):")
-                        for event in events[:5]:  # Show first 5 events
-                            report.append(f"    • {event.get('title', 'Untitled Event')}")
-                            report.append(f"      Date: {event.get('date', 'TBD')}")
-                            report.append(f"      Location: {event.get('location', 'Location TBD')}")
-                            
-                            # Show relevance information if available
-                            if event.get('relevance_score'):
-                                matched_interests = event.get('matched_interests', [])
-                                report.append(f"      Relevance: {event.get('relevance_score')} matches ({', '.join(matched_interests[:3])})")
-                            
-                            if event.get('description') and len(event['description']) > 50:
-                                desc = event['description'][:100] + '...' if len(event['description']) > 100 else event['description']
-                                report.append(f"      Description: {desc}")
-                            report.append("")
-                        
-                        if len(events) > 5:
-                            report.append(f"    ... and {len(events) - 5} more relevant events")
-                    else:
-                        report.append("  📅 No events found matching your interests")
-                    
-                    if news_items:
-                        report.append(f"  📰 Relevant Local News/Announcements ({len(news_items)} found):")
-                        for news in news_items[:3]:  # Show first 3 news items
-                            headline = news.get('headline', 'No headline')
-                            report.append(f"    • {headline}")
-                            
-                            # Show relevance information if available
-                            if news.get('relevance_score'):
-                                matched_interests = news.get('matched_interests', [])
-                                report.append(f"      Relevance: {news.get('relevance_score')} matches ({', '.join(matched_interests[:3])})")
-                            
-                            if news.get('context') and len(news['context']) > 50:
-                                context = news['context'][:150] + '...' if len(news['context']) > 150 else news['context']
-                                report.append(f"      {context}")
-                            report.append("")
-                    
-                    report.append(f"  Source: NFK Currents (scraped on {norfolk_events.get('scrape_date', 'unknown date')})")
-                
-                elif norfolk_events and norfolk_events.get('error'):
-                    report.append("  🏛️ Norfolk, VA area detected, but unable to fetch local events:")
-                    report.append(f"  Error: {norfolk_events['error']}")
-                
-                report.append("")
-        
-        report.append("="*80)
-        report.append("END OF REPORT")
-        report.append("="*80)
-        
-        return '\n'.join(report)
-
-def main():
-    """Main function"""
-    parser = argparse.ArgumentParser(description="Advanced OSINT Scraper")
-    parser.add_argument("--setup", action="store_true", help="Setup OSINT tools")
-    parser.add_argument("--name", help="Target's full name")
-    parser.add_argument("--email", help="Target's email address")
-    parser.add_argument("--social", nargs="*", help="Social media handles")
-    parser.add_argument("--address", help="Target's address")
-    parser.add_argument("--coordinates", nargs=2, type=float, help="Latitude and longitude")
-    parser.add_argument("--interactive", action="store_true", help="Interactive mode")
-    
-    args = parser.parse_args()
-    
-    # Initialize scraper
-    scraper = OSINTScraper()
-    
-    if args.setup:
-        scraper.setup()
-        return
-    
-    if args.interactive:
-        # Interactive mode
-        print(f"{Fore.CYAN}Welcome to Advanced OSINT Scraper{Style.RESET_ALL}")
-        print("Please provide target information:")
-        
-        full_name = input("Full Name: ").strip()
-        email = input("Email: ").strip()
-        
-        social_handles = []
-        while True:
-            handle = input("Social Media Handle (press Enter to skip): ").strip()
-            if not handle:
-                break
-            social_handles.append(handle)
-        
-        address = input("Address: ").strip()
-        
-        coord_input = input("Coordinates (lat,lon): ").strip()
-        coordinates = None
-        if coord_input:
-            try:
-                lat, lon = map(float, coord_input.split(','))
-                coordinates = (lat, lon)
-            except ValueError:
-                print("Invalid coordinates format. Skipping...")
-        
-        target = OSINTTarget(full_name, email, social_handles, address, coordinates)
-    else:
-        # Command line mode
-        if not args.name and not args.email:
-            print("Error: At least name or email must be provided")
-            return
-        
-        coordinates = tuple(args.coordinates) if args.coordinates else None
-        target = OSINTTarget(
-            args.name or "",
-            args.email or "",
-            args.social or [],
-            args.address or "",
-            coordinates
-        )
-    
-    # Setup tools if not already done
-    if not scraper.setup():
-        print("Warning: Some tools may not be available. Continuing with available tools...")
-    
-    # Run investigation
-    results = scraper.investigate_target(target)
-    
-    # Generate and display report
-    report = scraper.generate_report(results)
-    print("\n" + report)
-    
-    # Save report
-    report_file = scraper.config.output_dir / f"report_{target.full_name.replace(' ', '_').replace('/', '_')}_{int(time.time())}.txt"
-    try:
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report)
-        print(f"\n{Fore.GREEN}Report saved to: {report_file}{Style.RESET_ALL}")
-    except Exception as e:
-        print(f"\n{Fore.RED}Failed to save report: {str(e)}{Style.RESET_ALL}")
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Advanced OSINT Scraper
+Integrates Maigret, Recon-ng, and SpiderFoot for comprehensive intelligence gathering
+"""
+
+import os
+import io
+import re
+import sys
+import json
+import hashlib
+import sqlite3
+import subprocess
+import time
+import logging
+import atexit
+import itertools
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import argparse
+
+# Third-party imports
+import numpy as np
+import requests
+from colorama import init, Fore, Style
+
+# Optional native-C JSON encoder for large result dumps
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Optional streaming JSON parser so multi-MB scan outputs are filtered
+# while parsing instead of materialized whole
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
+
+# Optional JIT compiler for the username similarity kernel
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    numba = None
+
+# Load environment variables first
+from dotenv import load_dotenv
+load_dotenv()
+
+# Local imports (with fallback handling)
+try:
+    from osint_utilities import OSINTUtilities
+except ImportError:
+    print("Warning: osint_utilities module not found. Some features may be limited.")
+    OSINTUtilities = None
+
+# Initialize colorama for cross-platform colored output; skip colors
+# entirely when stdout is not a terminal (piped runs, cron, CI)
+_USE_COLOR = sys.stdout.isatty()
+init(autoreset=True, strip=not _USE_COLOR)
+
+# Level prefixes built once instead of re-formatted on every log call;
+# the colorless variants also keep ANSI bytes out of the log files
+if _USE_COLOR:
+    _LOG_PFX = {
+        'info': f"{Fore.GREEN}[INFO]{Style.RESET_ALL} ",
+        'warning': f"{Fore.YELLOW}[WARNING]{Style.RESET_ALL} ",
+        'error': f"{Fore.RED}[ERROR]{Style.RESET_ALL} ",
+        'success': f"{Fore.CYAN}[SUCCESS]{Style.RESET_ALL} ",
+    }
+else:
+    _LOG_PFX = {
+        'info': "[INFO] ",
+        'warning': "[WARNING] ",
+        'error': "[ERROR] ",
+        'success': "[SUCCESS] ",
+    }
+
+# Load environment variables with fallback
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    print("Warning: python-dotenv not installed. Environment variables will be loaded from system only.")
+    load_dotenv = lambda: None
+
+class OSINTConfig:
+    """Configuration management for OSINT tools"""
+    
+    def __init__(self):
+        self.base_dir = Path(__file__).parent
+        self.tools_dir = self.base_dir / "tools"
+        self.output_dir = self.base_dir / "output"
+        self.logs_dir = self.base_dir / "logs"
+        
+        # Create directories
+        for directory in [self.tools_dir, self.output_dir, self.logs_dir]:
+            directory.mkdir(exist_ok=True)
+            
+        # Tool paths
+        self.maigret_path = self.tools_dir / "maigret"
+        self.recon_ng_path = self.tools_dir / "recon-ng"
+        self.spiderfoot_path = self.tools_dir / "spiderfoot"
+        
+        # API Keys (only free APIs)
+        self.api_keys = {
+            # All APIs below are free to use
+            'openstreetmap': True,  # Free geocoding service
+            'overpass': True,       # Free OpenStreetMap data
+            # Note: Paid APIs have been removed to keep this tool completely free
+        }
+
+class OSINTLogger:
+    """Custom logger for OSINT operations
+
+    Log calls only enqueue the record; a background QueueListener does the
+    formatting and file/console IO, so hundreds of per-target lines during
+    parallel scans never block the scanning threads on disk writes.
+    """
+
+    def __init__(self, log_dir: Path):
+        self.log_file = log_dir / f"osint_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        # delay=True defers opening the file until the first record lands
+        file_handler = logging.FileHandler(self.log_file, delay=True)
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+
+        self._queue = queue.Queue(-1)
+        self._listener = QueueListener(self._queue, file_handler, stream_handler)
+        self._listener.start()
+        atexit.register(self.shutdown)
+
+        self.logger = logging.getLogger(__name__)
+        self.logger.setLevel(logging.INFO)
+        self.logger.handlers.clear()
+        self.logger.addHandler(QueueHandler(self._queue))
+        self.logger.propagate = False
+
+    def shutdown(self):
+        """Flush queued records and stop the background writer"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def info(self, message: str):
+        self.logger.info(_LOG_PFX['info'] + message)
+
+    def warning(self, message: str):
+        self.logger.warning(_LOG_PFX['warning'] + message)
+
+    def error(self, message: str):
+        self.logger.error(_LOG_PFX['error'] + message)
+
+    def success(self, message: str):
+        self.logger.info(_LOG_PFX['success'] + message)
+
+# One timestamp per process; unique output names derive from it with a
+# counter instead of re-reading the clock on every path build
+_RUN_ID = datetime.now().strftime("%Y%m%d_%H%M%S")
+_RUN_SEQ = itertools.count()
+
+def _run_name(stem: str) -> str:
+    """Unique per-run file or directory name, no per-call time syscalls"""
+    return f"{stem}_{_RUN_ID}_{next(_RUN_SEQ)}"
+
+# Filename-hostile characters mapped out in one C-level pass
+_FN_SANITIZE = str.maketrans({' ': '_', '/': '_', '\\': '_', ':': '_'})
+
+# "lat,lon" with optional sign/decimals; compiled once for interactive input
+_COORD_RE = re.compile(r'\s*([+-]?\d+(?:\.\d+)?)\s*,\s*([+-]?\d+(?:\.\d+)?)\s*$')
+
+# Report layout constants, built once instead of recomputed per line
+SEP_EQ = "=" * 80
+SEP_DASH = "-" * 40
+SEP_DASH_SHORT = "-" * 30
+REPORT_HEADER_TMPL = "{sep}\nOSINT INVESTIGATION REPORT\n{sep}\nGenerated: {ts}\n".format
+
+# Fixed emoji lines referenced by the renderers; defined once so every
+# report shares the same string objects
+_WARN_BREACH = "  ⚠️  Domain found in known breach lists\n"
+_OK_BREACH = "  ✅ Domain not in common breach lists\n"
+_EVENTS_HDR = "  🏛️ NORFOLK, VA LOCAL EVENTS:\n"
+_NO_EVENTS = "  📅 No events found matching your interests\n"
+_EVENTS_ERR_HDR = "  🏛️ Norfolk, VA area detected, but unable to fetch local events:\n"
+
+
+class _Tee:
+    """Write-only tee so a report can stream to several sinks at once"""
+
+    __slots__ = ('a', 'b')
+
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+    def write(self, s):
+        self.a.write(s)
+        self.b.write(s)
+
+
+def _head(seq, n: int):
+    """First n items of seq, lazily — avoids allocating the seq[:n] slice"""
+    return itertools.islice(seq, n)
+
+
+def _trunc(s: str, n: int, ell: str = '...') -> str:
+    """Truncate s to n characters, appending ell when anything was cut"""
+    return s if len(s) <= n else s[:n] + ell
+
+
+# --- Report section renderers -------------------------------------------
+# Module-level functions keyed by result section, so generate_report is a
+# single dispatch loop and absent sections cost one dict lookup each.
+# `w` is the sink's write; `_get` is default-bound so lookups stay local.
+
+def _render_maigret(maigret_results, w, _get=dict.get):
+    """Render the Maigret username-enumeration section"""
+    for username, results in maigret_results.items():
+        w(f"Username: {username}\n")
+        if type(results) is dict:
+            found = 0
+            for platform, data in results.items():
+                if type(data) is dict and _get(data, 'status') == 'found':
+                    found += 1
+                    w(f"  - {platform}: {_get(data, 'url', 'Found')}\n")
+            w(f"  Total profiles found: {found}\n")
+        w('\n')
+
+
+def _render_recon(recon_results, w, _get=dict.get):
+    """Render the Recon-ng domain-reconnaissance section"""
+    w(_get(recon_results, 'output', 'No output available'))
+    w('\n\n')
+
+
+def _render_spiderfoot(spiderfoot_results, w, _get=dict.get):
+    """Render the SpiderFoot scan-summary section"""
+    for target, results in spiderfoot_results.items():
+        w(f"Target: {target}\n")
+        # Summarize SpiderFoot results
+        if type(results) is list:
+            w(f"Total findings: {len(results)}\n")
+            # Group by data type
+            data_types = Counter(
+                _get(item, 'type', 'Unknown')
+                for item in results if type(item) is dict
+            )
+
+            for data_type, count in data_types.items():
+                w(f"  - {data_type}: {count}\n")
+        w('\n')
+
+
+def _render_domain_analysis(domain_analysis, w, _get=dict.get):
+    """Render the domain-analysis intelligence subsection"""
+    w(f"Domain Analysis for: {_get(domain_analysis, 'domain', 'N/A')}\n")
+
+    # DNS Records
+    dns_records = _get(domain_analysis, 'dns_records', {})
+    if dns_records:
+        w("  DNS Records:\n")
+        for record_type, records in dns_records.items():
+            if records:
+                w(f"    {record_type}: {', '.join(records[:3])}{'...' if len(records) > 3 else ''}\n")
+
+    # Subdomains
+    subdomains = _get(domain_analysis, 'subdomains', [])
+    if subdomains:
+        w(f"  Subdomains found: {len(subdomains)}\n")
+        for subdomain in _head(subdomains, 5):  # Show first 5
+            w(f"    - {subdomain}\n")
+        if len(subdomains) > 5:
+            w(f"    ... and {len(subdomains) - 5} more\n")
+
+    # IP Analysis
+    ip_analysis = _get(domain_analysis, 'ip_analysis', {})
+    if ip_analysis:
+        w("  IP Analysis:\n")
+        for ip, data in ip_analysis.items():
+            w(f"    IP: {ip}\n")
+
+            # Geolocation
+            geo = _get(data, 'geolocation', {})
+            if geo:
+                location = f"{_get(geo, 'city', 'Unknown')}, {_get(geo, 'country', 'Unknown')}"
+                w(f"      Location: {location}\n")
+                if _get(geo, 'isp'):
+                    w(f"      ISP: {_get(geo, 'isp')}\n")
+
+            # Port scan results
+            ports = _get(data, 'port_scan', {})
+            if ports and _get(ports, 'open_ports'):
+                w(f"      Open ports: {', '.join(map(str, ports['open_ports']))}\n")
+
+    # WHOIS Information
+    whois_info = _get(domain_analysis, 'whois', {})
+    if whois_info and not _get(whois_info, 'error'):
+        w(f"  WHOIS Information:\n"
+          f"    Registrar: {_get(whois_info, 'registrar', 'N/A')}\n"
+          f"    Creation Date: {_get(whois_info, 'creation_date', 'N/A')}\n"
+          f"    Expiration Date: {_get(whois_info, 'expiration_date', 'N/A')}\n")
+
+    # SSL Information
+    ssl_info = _get(domain_analysis, 'ssl_info', {})
+    if ssl_info and not _get(ssl_info, 'error'):
+        w("  SSL Certificate:\n")
+        subject = _get(ssl_info, 'subject', {})
+        if subject:
+            w(f"    Subject: {_get(subject, 'commonName', 'N/A')}\n")
+        issuer = _get(ssl_info, 'issuer', {})
+        if issuer:
+            w(f"    Issuer: {_get(issuer, 'organizationName', 'N/A')}\n")
+        w(f"    Valid Until: {_get(ssl_info, 'notAfter', 'N/A')}\n")
+
+    w('\n')
+
+
+def _render_email_investigation(email_investigation, w, _get=dict.get):
+    """Render the email-investigation intelligence subsection"""
+    w(f"Email Investigation for: {_get(email_investigation, 'email', 'N/A')}\n")
+
+    # Format validation
+    format_check = _get(email_investigation, 'format_validation', {})
+    if format_check:
+        w(f"  Email Format: {'Valid' if _get(format_check, 'format_valid') else 'Invalid'}\n"
+          f"  Domain: {_get(format_check, 'domain', 'N/A')}\n")
+
+    # MX Record check
+    mx_check = _get(email_investigation, 'domain_mx_check', {})
+    if mx_check:
+        w(f"  MX Records: {'Yes' if _get(mx_check, 'has_mx') else 'No'}\n")
+
+    # Basic breach check
+    breach_check = _get(email_investigation, 'breach_check', {})
+    if breach_check:
+        if _get(breach_check, 'domain_in_known_breaches'):
+            w(_WARN_BREACH)
+        else:
+            w(_OK_BREACH)
+
+    w('\n')
+
+
+def _render_social_search(social_search, w, _get=dict.get):
+    """Render the social-media-search intelligence subsection"""
+    w("SOCIAL MEDIA SEARCH:\n")
+    w(SEP_DASH_SHORT)
+    w('\n')
+    for username, results in social_search.items():
+        w(f"Username: {username}\n")
+        verified = _get(results, 'verified_profiles', [])
+        potential = _get(results, 'potential_profiles', [])
+
+        if verified:
+            w(f"  ✅ Verified profiles ({len(verified)}):\n")
+            for profile in verified:
+                w(f"    - {profile['platform']}: {profile['url']}\n")
+
+        w(f"  🔍 Potential profiles to check: {len(potential)}\n")
+        for profile in _head(potential, 5):  # Show first 5
+            w(f"    - {profile['platform']}: {profile['url']}\n")
+
+        if len(potential) > 5:
+            w(f"    ... and {len(potential) - 5} more\n")
+
+        w('\n')
+
+    w('\n')
+
+
+def _render_location_analysis(location_analysis, w, _get=dict.get):
+    """Render the location-analysis intelligence subsection"""
+    coordinates = _get(location_analysis, 'coordinates', 'N/A')
+    w(f"Location Analysis for: {coordinates}\n")
+
+    # Reverse Geocoding
+    geocoding = _get(location_analysis, 'reverse_geocoding', {})
+    if geocoding and 'display_name' in geocoding:
+        w(f"  Address: {geocoding['display_name']}\n")
+
+    # Nearby Places
+    nearby_places = _get(location_analysis, 'nearby_places', [])
+    if nearby_places:
+        w(f"  Nearby Places of Interest: {len(nearby_places)}\n")
+        # Group by type
+        place_types = Counter(
+            _get(place, 'type', 'Unknown') for place in nearby_places
+        )
+
+        for place_type, count in place_types.most_common(5):  # Show top 5
+            w(f"    - {place_type}: {count}\n")
+
+    # Norfolk Events (if location is in Norfolk, VA area)
+    norfolk_events = _get(location_analysis, 'norfolk_events')
+    if norfolk_events and not _get(norfolk_events, 'error'):
+        w(_EVENTS_HDR)
+        w("  " + "-" * 35)
+        w('\n')
+
+        # Show filtering information if applied
+        if _get(norfolk_events, 'filter_applied'):
+            user_interests = _get(norfolk_events, 'user_interests', [])
+            w(f"  🎯 Filtered based on detected interests: {', '.join(user_interests[:5])}{'...' if len(user_interests) > 5 else ''}\n"
+              f"  📊 Showing {_get(norfolk_events, 'events_found', 0)} relevant events (from {_get(norfolk_events, 'original_events_count', 0)} total)\n"
+              f"\n")
+
+        events = _get(norfolk_events, 'events', [])
+        news_items = _get(norfolk_events, 'news_items', [])
+
+        if events:
+            w(f"  📅 Relevant Events ({len(events)} found):\n")
+            for event in _head(events, 5):  # Show first 5 events
+                relevance_score = _get(event, 'relevance_score')
+                description = _get(event, 'description')
+                w(f"    • {_get(event, 'title', 'Untitled Event')}\n"
+                  f"      Date: {_get(event, 'date', 'TBD')}\n"
+                  f"      Location: {_get(event, 'location', 'Location TBD')}\n")
+
+                # Show relevance information if available
+                if relevance_score:
+                    matched_interests = _get(event, 'matched_interests', [])
+                    w(f"      Relevance: {relevance_score} matches ({', '.join(matched_interests[:3])})\n")
+
+                if description and len(description) > 50:
+                    w(f"      Description: {_trunc(description, 100)}\n")
+                w('\n')
+
+            if len(events) > 5:
+                w(f"    ... and {len(events) - 5} more relevant events\n")
+        else:
+            w(_NO_EVENTS)
+
+        if news_items:
+            w(f"  📰 Relevant Local News/Announcements ({len(news_items)} found):\n")
+            for news in _head(news_items, 3):  # Show first 3 news items
+                relevance_score = _get(news, 'relevance_score')
+                context = _get(news, 'context')
+                w(f"    • {_get(news, 'headline', 'No headline')}\n")
+
+                # Show relevance information if available
+                if relevance_score:
+                    matched_interests = _get(news, 'matched_interests', [])
+                    w(f"      Relevance: {relevance_score} matches ({', '.join(matched_interests[:3])})\n")
+
+                if context and len(context) > 50:
+                    w(f"      {_trunc(context, 150)}\n")
+                w('\n')
+
+        w(f"  Source: NFK Currents (scraped on {_get(norfolk_events, 'scrape_date', 'unknown date')})\n")
+
+    elif norfolk_events and _get(norfolk_events, 'error'):
+        w(_EVENTS_ERR_HDR)
+        w(f"  Error: {norfolk_events['error']}\n")
+
+    w('\n')
+
+
+# Subsections under additional_intel; each renderer writes its own heading
+_INTEL_SECTIONS = (
+    ('domain_analysis', _render_domain_analysis),
+    ('email_investigation', _render_email_investigation),
+    ('social_media_search', _render_social_search),
+    ('location_analysis', _render_location_analysis),
+)
+
+
+def _render_additional_intel(additional_intel, w, _get=dict.get):
+    """Render the additional-intelligence section and its subsections"""
+    for key, render in _INTEL_SECTIONS:
+        data = _get(additional_intel, key)
+        if data:
+            render(data, w)
+
+
+# Top-level report sections: result key, heading, renderer
+_REPORT_SECTIONS = (
+    ('maigret_results', "MAIGRET RESULTS (Username Enumeration):", _render_maigret),
+    ('recon_ng_results', "RECON-NG RESULTS (Domain Reconnaissance):", _render_recon),
+    ('spiderfoot_results', "SPIDERFOOT RESULTS (Comprehensive Scan):", _render_spiderfoot),
+    ('additional_intel', "ADDITIONAL INTELLIGENCE:", _render_additional_intel),
+)
+
+# Keys the dispatch loop cares about; one C-level set intersection tells
+# whether a result dict has any renderable section at all
+_SECTION_KEYS = frozenset(key for key, _, _ in _REPORT_SECTIONS)
+
+# Sections are disjoint reductions, so on free-threaded builds they can
+# render concurrently; under the GIL the threads would just serialize,
+# so the dispatch loop stays serial there
+_PARALLEL_RENDER = not getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+def _render_section_buffered(section):
+    """Render one (title, renderer, data) section into its own buffer"""
+    title, render, data = section
+    buf = io.StringIO()
+    buf.write(title)
+    buf.write('\n')
+    buf.write(SEP_DASH)
+    buf.write('\n')
+    render(data, buf.write)
+    return buf.getvalue()
+
+# Entity types the report actually summarizes; everything else in a
+# SpiderFoot dump is dead weight in investigation_results
+_SPIDERFOOT_KEEP_TYPES = {'IP_ADDRESS', 'DOMAIN_NAME', 'EMAILADDR'}
+
+def _maigret_keep(value) -> bool:
+    """Keep found-profile entries and scalar metadata, drop not-found sites"""
+    return not isinstance(value, dict) or value.get('status') == 'found'
+
+def _load_maigret_json(json_file: Path) -> Dict:
+    """Load a Maigret dump keeping only hits
+
+    Maigret reports every probed site; only found profiles reach the
+    report, so not-found entries are dropped during parsing (streamed
+    with ijson when available) to shrink peak memory.
+    """
+    if IJSON_AVAILABLE:
+        with open(json_file, 'rb') as f:
+            return {k: v for k, v in ijson.kvitems(f, '') if _maigret_keep(v)}
+    with open(json_file, 'r') as f:
+        return {k: v for k, v in json.load(f).items() if _maigret_keep(v)}
+
+def _load_spiderfoot_json(output_file: Path) -> List[Dict]:
+    """Load a SpiderFoot dump keeping only reportable entity types"""
+    if IJSON_AVAILABLE:
+        with open(output_file, 'rb') as f:
+            return [item for item in ijson.items(f, 'item')
+                    if isinstance(item, dict) and item.get('type') in _SPIDERFOOT_KEEP_TYPES]
+    with open(output_file, 'r') as f:
+        events = json.load(f)
+    if not isinstance(events, list):
+        return events
+    return [item for item in events
+            if isinstance(item, dict) and item.get('type') in _SPIDERFOOT_KEEP_TYPES]
+
+# Usernames longer than this are truncated before scoring
+_USERNAME_SCORE_WIDTH = 64
+
+def _levenshtein_impl(a: np.ndarray, b: np.ndarray) -> int:
+    """Edit distance between two uint8 arrays (two-row DP)"""
+    n, m = a.shape[0], b.shape[0]
+    if n == 0:
+        return m
+    if m == 0:
+        return n
+    prev = np.arange(m + 1, dtype=np.int32)
+    curr = np.empty(m + 1, dtype=np.int32)
+    for i in range(n):
+        curr[0] = i + 1
+        for j in range(m):
+            cost = 0 if a[i] == b[j] else 1
+            curr[j + 1] = min(prev[j + 1] + 1, curr[j] + 1, prev[j] + cost)
+        prev, curr = curr, prev
+    return int(prev[m])
+
+if NUMBA_AVAILABLE:
+    levenshtein = numba.njit(cache=True)(_levenshtein_impl)
+
+    @numba.njit(cache=True, parallel=True)
+    def _score_matrix(va, vlens, ca, clens):
+        out = np.empty((va.shape[0], ca.shape[0]), dtype=np.float64)
+        for i in numba.prange(va.shape[0]):
+            for j in range(ca.shape[0]):
+                distance = levenshtein(va[i, :vlens[i]], ca[j, :clens[j]])
+                longest = max(vlens[i], clens[j])
+                out[i, j] = 1.0 - distance / longest if longest > 0 else 1.0
+        return out
+else:
+    levenshtein = _levenshtein_impl
+
+    def _score_matrix(va, vlens, ca, clens):
+        out = np.empty((va.shape[0], ca.shape[0]), dtype=np.float64)
+        for i in range(va.shape[0]):
+            for j in range(ca.shape[0]):
+                distance = levenshtein(va[i, :vlens[i]], ca[j, :clens[j]])
+                longest = max(vlens[i], clens[j])
+                out[i, j] = 1.0 - distance / longest if longest > 0 else 1.0
+        return out
+
+def _encode_usernames(usernames: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Pack usernames into a padded uint8 matrix plus a length column"""
+    arr = np.zeros((len(usernames), _USERNAME_SCORE_WIDTH), dtype=np.uint8)
+    lens = np.empty(len(usernames), dtype=np.int32)
+    for i, name in enumerate(usernames):
+        encoded = name.encode('utf-8')[:_USERNAME_SCORE_WIDTH]
+        lens[i] = len(encoded)
+        arr[i, :len(encoded)] = np.frombuffer(encoded, dtype=np.uint8)
+    return arr, lens
+
+def score_username_matches(variants: List[str], candidates: List[str]) -> np.ndarray:
+    """Normalized similarity matrix between variant and candidate usernames
+
+    Returns a (len(variants), len(candidates)) float array where 1.0 means
+    identical and 0.0 means nothing in common. The edit-distance kernel runs
+    as a compiled parallel loop when numba is installed.
+    """
+    if not variants or not candidates:
+        return np.zeros((len(variants), len(candidates)), dtype=np.float64)
+    va, vlens = _encode_usernames(variants)
+    ca, clens = _encode_usernames(candidates)
+    return _score_matrix(va, vlens, ca, clens)
+
+@lru_cache(maxsize=None)
+def _tool_git_sha(tool_path: str) -> str:
+    """Current git commit of a cloned tool checkout, for cache keying"""
+    try:
+        result = subprocess.run(
+            ["git", "-C", tool_path, "rev-parse", "HEAD"],
+            capture_output=True, text=True, timeout=10
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except Exception:
+        pass
+    return "unknown"
+
+class BloomFilter:
+    """Minimal persistent Bloom filter for already-seen keys
+
+    1M bits with 7 probes keeps the false-positive rate well under 1%
+    for tens of thousands of entries. Membership can only say "maybe
+    seen", so callers must verify hits against real stored results.
+    """
+
+    def __init__(self, path: Path, num_bits: int = 1 << 20, num_hashes: int = 7):
+        self.path = path
+        self.num_hashes = num_hashes
+        if path.exists():
+            self.bits = bytearray(path.read_bytes())
+            self.num_bits = len(self.bits) * 8
+        else:
+            self.bits = bytearray(num_bits // 8)
+            self.num_bits = num_bits
+
+    def _indexes(self, key: str):
+        # Double hashing over one sha1 digest yields the k probe positions
+        digest = hashlib.sha1(key.encode('utf-8')).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:16], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[i >> 3] & (1 << (i & 7)) for i in self._indexes(key))
+
+    def add(self, key: str) -> None:
+        for i in self._indexes(key):
+            self.bits[i >> 3] |= 1 << (i & 7)
+
+    def save(self) -> None:
+        self.path.write_bytes(bytes(self.bits))
+
+class ResultCache:
+    """Persistent cache for expensive tool invocations
+
+    Maigret and SpiderFoot runs take minutes per target, and repeat
+    investigations often cover the same usernames and domains. Results are
+    stored in a SQLite lookup keyed on (tool, target, scan type, tool
+    version) so repeats return instantly; entries expire after 30 days so
+    stale footprints eventually refresh.
+    """
+
+    TTL_SECONDS = 30 * 86400
+
+    def __init__(self, cache_path: Path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(cache_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key TEXT PRIMARY KEY, payload TEXT, ts REAL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def build_key(tool: str, target: str, scan_type: str = "", tool_version: str = "") -> str:
+        """Stable cache key covering everything that affects tool output"""
+        raw = f"{tool}:{target}:{scan_type}:{tool_version}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached result for key, or None on miss/expiry"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, ts FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        if not row:
+            return None
+        payload, ts = row
+        if time.time() - ts > self.TTL_SECONDS:
+            with self._lock:
+                self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                self._conn.commit()
+            return None
+        try:
+            return json.loads(payload)
+        except (ValueError, TypeError):
+            return None
+
+    def set(self, key: str, result: Dict) -> None:
+        """Store a tool result, stamped with the current time"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, payload, ts) VALUES (?, ?, ?)",
+                (key, json.dumps(result, default=str), time.time())
+            )
+            self._conn.commit()
+
+class ToolManager:
+    """Manages installation and execution of OSINT tools"""
+    
+    def __init__(self, config: OSINTConfig, logger: OSINTLogger):
+        self.config = config
+        self.logger = logger
+    
+    def check_tool_installation(self, tool_name: str) -> bool:
+        """Check if a tool is installed"""
+        tool_paths = {
+            'maigret': self.config.maigret_path,
+            'recon-ng': self.config.recon_ng_path,
+            'spiderfoot': self.config.spiderfoot_path
+        }
+        
+        if tool_name in tool_paths:
+            return tool_paths[tool_name].exists()
+        
+        # Check if tool is available in PATH
+        try:
+            subprocess.run([tool_name, '--help'], 
+                         capture_output=True, check=True, timeout=10)
+            return True
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            return False
+    
+    def install_maigret(self) -> bool:
+        """Install Maigret"""
+        try:
+            self.logger.info("Installing Maigret...")
+            
+            # Clone Maigret repository
+            cmd = ["git", "clone", "https://github.com/soxoj/maigret.git", str(self.config.maigret_path)]
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            
+            if result.returncode != 0:
+                self.logger.error(f"Failed to clone Maigret: {result.stderr}")
+                return False
+            
+            # Install dependencies
+            pip_cmd = [sys.executable, "-m", "pip", "install", "-r", 
+                      str(self.config.maigret_path / "requirements.txt")]
+            result = subprocess.run(pip_cmd, capture_output=True, text=True, timeout=300)
+            
+            if result.returncode != 0:
+                self.logger.error(f"Failed to install Maigret dependencies: {result.stderr}")
+                return False
+            
+            self.logger.success("Maigret installed successfully")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error installing Maigret: {str(e)}")
+            return False
+    
+    def install_recon_ng(self) -> bool:
+        """Install Recon-ng"""
+        try:
+            self.logger.info("Installing Recon-ng...")
+            
+            # Clone Recon-ng repository
+            cmd = ["git", "clone", "https://github.com/lanmaster53/recon-ng.git", str(self.config.recon_ng_path)]
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            
+            if result.returncode != 0:
+                self.logger.error(f"Failed to clone Recon-ng: {result.stderr}")
+                return False
+            
+            # Install dependencies
+            pip_cmd = [sys.executable, "-m", "pip", "install", "-r", 
+                      str(self.config.recon_ng_path / "REQUIREMENTS")]
+            result = subprocess.run(pip_cmd, capture_output=True, text=True, timeout=300)
+            
+            if result.returncode != 0:
+                self.logger.error(f"Failed to install Recon-ng dependencies: {result.stderr}")
+                return False
+            
+            self.logger.success("Recon-ng installed successfully")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error installing Recon-ng: {str(e)}")
+            return False
+    
+    def install_spiderfoot(self) -> bool:
+        """Install SpiderFoot"""
+        try:
+            self.logger.info("Installing SpiderFoot...")
+            
+            # Clone SpiderFoot repository
+            cmd = ["git", "clone", "https://github.com/smicallef/spiderfoot.git", str(self.config.spiderfoot_path)]
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            
+            if result.returncode != 0:
+                self.logger.error(f"Failed to clone SpiderFoot: {result.stderr}")
+                return False
+            
+            # Install dependencies
+            pip_cmd = [sys.executable, "-m", "pip", "install", "-r", 
+                      str(self.config.spiderfoot_path / "requirements.txt")]
+            result = subprocess.run(pip_cmd, capture_output=True, text=True, timeout=300)
+            
+            if result.returncode != 0:
+                self.logger.error(f"Failed to install SpiderFoot dependencies: {result.stderr}")
+                return False
+            
+            self.logger.success("SpiderFoot installed successfully")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error installing SpiderFoot: {str(e)}")
+            return False
+    
+    def setup_tools(self) -> Dict[str, bool]:
+        """Setup all OSINT tools"""
+        tools_status = {}
+        
+        # Check and install Maigret
+        if not self.check_tool_installation('maigret'):
+            tools_status['maigret'] = self.install_maigret()
+        else:
+            tools_status['maigret'] = True
+            self.logger.info("Maigret already installed")
+        
+        # Check and install Recon-ng
+        if not self.check_tool_installation('recon-ng'):
+            tools_status['recon-ng'] = self.install_recon_ng()
+        else:
+            tools_status['recon-ng'] = True
+            self.logger.info("Recon-ng already installed")
+        
+        # Check and install SpiderFoot
+        if not self.check_tool_installation('spiderfoot'):
+            tools_status['spiderfoot'] = self.install_spiderfoot()
+        else:
+            tools_status['spiderfoot'] = True
+            self.logger.info("SpiderFoot already installed")
+        
+        return tools_status
+
+class MaigretIntegration:
+    """Integration with Maigret for username enumeration"""
+
+    def __init__(self, config: OSINTConfig, logger: OSINTLogger,
+                 cache: Optional[ResultCache] = None):
+        self.config = config
+        self.logger = logger
+        self.cache = cache
+        self.maigret_script = self.config.maigret_path / "maigret.py"
+        # Built once: subprocess otherwise copies os.environ per invocation
+        self._cmd_prefix = (sys.executable, str(self.maigret_script))
+        self._env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+
+    def _cache_key(self, username: str) -> str:
+        """Cache key for one username against the current Maigret checkout"""
+        return ResultCache.build_key(
+            'maigret', username, 'username',
+            _tool_git_sha(str(self.config.maigret_path))
+        )
+
+    def search_username(self, username: str, output_dir: Path) -> Dict:
+        """Search for a single username across social media platforms"""
+        return self.search_usernames([username], output_dir).get(username, {})
+
+    def search_usernames(self, usernames: List[str], output_dir: Path) -> Dict[str, Dict]:
+        """Search many usernames with a single Maigret invocation
+
+        Maigret accepts multiple usernames per run, so one interpreter
+        startup is amortized across all variants instead of paid per
+        username. Cached usernames are skipped entirely.
+        """
+        results: Dict[str, Dict] = {}
+
+        pending = []
+        for username in usernames:
+            cached = self.cache.get(self._cache_key(username)) if self.cache else None
+            if cached is not None:
+                self.logger.info(f"Using cached Maigret results for {username}")
+                results[username] = cached
+            else:
+                pending.append(username)
+
+        if not pending:
+            return results
+
+        try:
+            self.logger.info(f"Running Maigret search for {len(pending)} username(s)")
+
+            output_folder = output_dir / _run_name("maigret")
+
+            cmd = (
+                *self._cmd_prefix,
+                *pending,
+                "--folderoutput", str(output_folder),
+                "--json", "simple",
+                "--timeout", "30"
+            )
+
+            result = subprocess.run(cmd, capture_output=True, text=True,
+                                    env=self._env,
+                                    timeout=600 + 60 * len(pending))
+
+            if result.returncode == 0:
+                self.logger.success(f"Maigret search completed for {len(pending)} username(s)")
+
+                # Index the JSON reports by the exact username parsed from
+                # Maigret's deterministic report_<username>_simple.json
+                # naming; substring globs would conflate overlapping
+                # variants like "johnd" and "johndoe"
+                report_index: Dict[str, Path] = {}
+                for report_file in output_folder.rglob("*.json"):
+                    stem = report_file.stem
+                    if stem.startswith("report_"):
+                        stem = stem[len("report_"):]
+                    if stem.endswith("_simple"):
+                        stem = stem[:-len("_simple")]
+                    report_index[stem] = report_file
+
+                for username in pending:
+                    json_file = report_index.get(username)
+                    if json_file is None:
+                        continue
+                    search_results = _load_maigret_json(json_file)
+                    if search_results:
+                        results[username] = search_results
+                        if self.cache:
+                            self.cache.set(self._cache_key(username), search_results)
+            else:
+                self.logger.error(f"Maigret search failed: {result.stderr}")
+
+        except Exception as e:
+            self.logger.error(f"Error running Maigret: {str(e)}")
+
+        return results
+
+class ReconNGIntegration:
+    """Integration with Recon-ng for reconnaissance"""
+    
+    def __init__(self, config: OSINTConfig, logger: OSINTLogger):
+        self.config = config
+        self.logger = logger
+        # Updated to use the correct Recon-ng entry point
+        self.recon_script = self.config.recon_ng_path / "recon-ng"
+        # Fallback for Windows
+        if not self.recon_script.exists():
+            self.recon_script = self.config.recon_ng_path / "recon-ng.py"
+        # Built once: subprocess otherwise copies os.environ per invocation
+        self._cmd_prefix = (sys.executable, str(self.recon_script))
+        self._env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+
+    def create_workspace(self, workspace_name: str) -> bool:
+        """Create a new Recon-ng workspace"""
+        try:
+            cmd = (
+                *self._cmd_prefix,
+                "-w", workspace_name,
+                "-x", "exit"
+            )
+
+            result = subprocess.run(cmd, capture_output=True, text=True,
+                                    env=self._env, timeout=60)
+            return result.returncode == 0
+            
+        except Exception as e:
+            self.logger.error(f"Error creating Recon-ng workspace: {str(e)}")
+            return False
+    
+    def run_domain_recon(self, domain: str, workspace_name: str) -> Dict:
+        """Run domain reconnaissance using Recon-ng"""
+        try:
+            self.logger.info(f"Running Recon-ng domain reconnaissance for: {domain}")
+            
+            # Create workspace
+            if not self.create_workspace(workspace_name):
+                self.logger.error("Failed to create Recon-ng workspace")
+                return {}
+            
+            # Run reconnaissance modules
+            commands = [
+                f"use recon/domains-hosts/hackertarget",
+                f"set SOURCE {domain}",
+                "run",
+                f"use recon/hosts-hosts/resolve",
+                "run",
+                "show hosts"
+            ]
+            
+            cmd_file = self.config.output_dir / f'{_run_name("recon_commands")}.txt'
+            with open(cmd_file, 'w') as f:
+                f.write('\n'.join(commands))
+            
+            cmd = (
+                *self._cmd_prefix,
+                "-w", workspace_name,
+                "-r", str(cmd_file)
+            )
+
+            result = subprocess.run(cmd, capture_output=True, text=True,
+                                    env=self._env, timeout=300)
+            
+            if result.returncode == 0:
+                self.logger.success(f"Recon-ng domain reconnaissance completed for {domain}")
+                return {"output": result.stdout, "error": result.stderr}
+            else:
+                self.logger.error(f"Recon-ng failed: {result.stderr}")
+            
+            return {}
+            
+        except Exception as e:
+            self.logger.error(f"Error running Recon-ng: {str(e)}")
+            return {}
+
+class SpiderFootIntegration:
+    """Integration with SpiderFoot for automated OSINT scanning"""
+
+    # 30 minutes per scan
+    SCAN_TIMEOUT = 1800
+
+    def __init__(self, config: OSINTConfig, logger: OSINTLogger,
+                 cache: Optional[ResultCache] = None):
+        self.config = config
+        self.logger = logger
+        self.cache = cache
+        self.spiderfoot_script = self.config.spiderfoot_path / "sf.py"
+        # Built once: subprocess otherwise copies os.environ per invocation
+        self._cmd_prefix = (sys.executable, str(self.spiderfoot_script))
+        self._env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+
+    def _cache_key(self, target: str, scan_type: str) -> str:
+        """Cache key for one scan against the current SpiderFoot checkout"""
+        return ResultCache.build_key(
+            'spiderfoot', target, scan_type,
+            _tool_git_sha(str(self.config.spiderfoot_path))
+        )
+
+    def cached_result(self, target: str, scan_type: str = "all") -> Optional[Dict]:
+        """Previously cached scan results, or None"""
+        if not self.cache:
+            return None
+        return self.cache.get(self._cache_key(target, scan_type))
+
+    def start_scan(self, target: str, scan_type: str = "all") -> Optional[Tuple]:
+        """Launch a SpiderFoot scan without blocking
+
+        Child stdout/stderr stream straight to a log file, so nothing is
+        buffered on the Python side and many scans can run while one
+        thread reaps them. Returns a (process, output_file, log_handle)
+        handle for collect_scan, or None if the launch failed.
+        """
+        try:
+            self.logger.info(f"Running SpiderFoot scan for: {target}")
+
+            output_file = self.config.output_dir / f"{_run_name('spiderfoot_' + target.replace('.', '_'))}.json"
+
+            cmd = (
+                *self._cmd_prefix,
+                "-s", target,
+                "-t", scan_type,
+                "-j",
+                "-o", str(output_file)
+            )
+
+            log_handle = open(output_file.with_suffix('.log'), 'wb')
+            proc = subprocess.Popen(cmd, stdout=log_handle, stderr=subprocess.STDOUT,
+                                    env=self._env)
+            return proc, output_file, log_handle
+
+        except Exception as e:
+            self.logger.error(f"Error running SpiderFoot: {str(e)}")
+            return None
+
+    def collect_scan(self, handle: Tuple, target: str, scan_type: str = "all") -> Dict:
+        """Collect results from a finished scan launched by start_scan"""
+        proc, output_file, log_handle = handle
+        log_handle.close()
+
+        if proc.returncode == 0:
+            self.logger.success(f"SpiderFoot scan completed for {target}")
+
+            if output_file.exists():
+                scan_results = _load_spiderfoot_json(output_file)
+                if self.cache and scan_results:
+                    self.cache.set(self._cache_key(target, scan_type), scan_results)
+                return scan_results
+        else:
+            self.logger.error(
+                f"SpiderFoot scan failed for {target}; see {output_file.with_suffix('.log')}"
+            )
+
+        return {}
+
+    def run_scan(self, target: str, scan_type: str = "all") -> Dict:
+        """Run SpiderFoot scan, blocking until it completes"""
+        cached = self.cached_result(target, scan_type)
+        if cached is not None:
+            self.logger.info(f"Using cached SpiderFoot results for {target}")
+            return cached
+
+        handle = self.start_scan(target, scan_type)
+        if handle is None:
+            return {}
+
+        proc = handle[0]
+        try:
+            proc.wait(timeout=self.SCAN_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        return self.collect_scan(handle, target, scan_type)
+
+class OSINTTarget:
+    """Represents an OSINT investigation target"""
+    
+    def __init__(self, full_name: str = "", email: str = "", 
+                 social_handles: List[str] = None, address: str = "", 
+                 coordinates: Tuple[float, float] = None):
+        self.full_name = full_name
+        self.email = email
+        self.social_handles = social_handles or []
+        self.address = address
+        self.coordinates = coordinates  # (latitude, longitude)
+        
+        # Derived information
+        self.domain = email.split('@')[1] if email and '@' in email else ""
+        self.slug = full_name.translate(_FN_SANITIZE) if full_name else "target"
+
+    @cached_property
+    def username_variants(self) -> Tuple[str, ...]:
+        """Possible username variants, generated once per target"""
+        return self._generate_username_variants(self.full_name, tuple(self.social_handles))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _generate_username_variants(full_name: str, social_handles: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Generate possible username variants from full name
+
+        Memoized on (full_name, social_handles) so bulk investigations that
+        revisit the same person don't rebuild the same string combinations.
+        """
+        if not full_name:
+            return ()
+
+        name_parts = full_name.lower().split()
+        if len(name_parts) < 2:
+            return (full_name.lower(),)
+
+        first, last = name_parts[0], name_parts[-1]
+
+        # Common username patterns plus known social media handles; interned
+        # because the same variants recur as dict and cache keys downstream
+        variants = (
+            f"{first}{last}",
+            f"{first}.{last}",
+            f"{first}_{last}",
+            f"{first}{last[0]}",
+            f"{first[0]}{last}",
+            f"{last}{first}",
+            f"{last}.{first}",
+            f"{last}_{first}"
+        ) + social_handles
+
+        # dict.fromkeys dedups while preserving pattern order
+        return tuple(dict.fromkeys(map(sys.intern, variants)))
+
+class OSINTTargetBatch:
+    """Structure-of-arrays storage for bulk investigation targets
+
+    Bulk investigations filter and match on whole columns (coordinates,
+    domains) across hundreds of targets. Keeping each column in a
+    contiguous numpy array turns those passes into vectorized sequential
+    scans instead of per-object attribute chasing, while `target(i)`
+    still materializes a plain OSINTTarget for the tool integrations.
+    """
+
+    def __init__(self, targets: Optional[List[OSINTTarget]] = None):
+        targets = targets or []
+        self.names = np.array([t.full_name for t in targets], dtype=str)
+        self.emails = np.array([t.email for t in targets], dtype=str)
+        self.domains = np.array([t.domain for t in targets], dtype=str)
+        self.addresses = np.array([t.address for t in targets], dtype=str)
+        # (N, 2) latitude/longitude; NaN marks targets without coordinates
+        self.coords = np.array(
+            [t.coordinates if t.coordinates else (np.nan, np.nan) for t in targets],
+            dtype=np.float64
+        ).reshape(-1, 2)
+        # Ragged per-target handle lists stay as plain tuples
+        self.social_handles = [tuple(t.social_handles) for t in targets]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def target(self, index: int) -> OSINTTarget:
+        """Materialize one row as a regular OSINTTarget"""
+        lat, lon = self.coords[index]
+        return OSINTTarget(
+            full_name=str(self.names[index]),
+            email=str(self.emails[index]),
+            social_handles=list(self.social_handles[index]),
+            address=str(self.addresses[index]),
+            coordinates=None if np.isnan(lat) else (float(lat), float(lon))
+        )
+
+    def filter_by_location(self, lat_min: float, lat_max: float,
+                           lon_min: float, lon_max: float) -> np.ndarray:
+        """Indices of targets whose coordinates fall inside the bounding box"""
+        lat, lon = self.coords[:, 0], self.coords[:, 1]
+        return np.where((lat > lat_min) & (lat < lat_max) &
+                        (lon > lon_min) & (lon < lon_max))[0]
+
+    def filter_by_domain(self, domain: str) -> np.ndarray:
+        """Indices of targets whose email domain matches"""
+        return np.where(self.domains == domain.lower())[0]
+
+    def generate_all_username_variants(self) -> List[Tuple[str, ...]]:
+        """Username variants for every target, concatenated column-wise
+
+        First/last name splits and the pattern concatenations run as
+        np.char operations over whole columns; only the per-row dedup
+        with the ragged social handle lists stays in Python.
+        """
+        if not len(self):
+            return []
+
+        lowered = np.char.lower(self.names)
+        first = np.char.partition(lowered, ' ')[..., 0]
+        last = np.char.rpartition(lowered, ' ')[..., 2]
+        # Casting to U1 truncates to the leading character
+        first_initial = first.astype('U1')
+        last_initial = last.astype('U1')
+
+        variant_matrix = np.stack([
+            np.char.add(first, last),
+            np.char.add(np.char.add(first, '.'), last),
+            np.char.add(np.char.add(first, '_'), last),
+            np.char.add(first, last_initial),
+            np.char.add(first_initial, last),
+            np.char.add(last, first),
+            np.char.add(np.char.add(last, '.'), first),
+            np.char.add(np.char.add(last, '_'), first),
+        ], axis=1)
+
+        single_word = first == last
+        all_variants = []
+        for row in range(len(self)):
+            if not lowered[row]:
+                all_variants.append(())
+            elif single_word[row]:
+                all_variants.append((str(lowered[row]),))
+            else:
+                all_variants.append(tuple(dict.fromkeys(
+                    tuple(map(str, variant_matrix[row])) + self.social_handles[row]
+                )))
+        return all_variants
+
+class OSINTScraper:
+    """Main OSINT scraper class"""
+
+    # SpiderFoot scans are memory-hungry, cap how many children run at once
+    MAX_CONCURRENT_SPIDERFOOT = 2
+
+    def __init__(self):
+        self.config = OSINTConfig()
+        self.logger = OSINTLogger(self.config.logs_dir)
+        self.tool_manager = ToolManager(self.config, self.logger)
+
+        # One output prefix per run; per-target directories nest under it
+        self._run_id = _RUN_ID
+        self._run_base = self.config.output_dir / f"run_{self._run_id}"
+
+        # Trigger JIT compilation of the similarity kernel up front so the
+        # first real match stage doesn't pay the compile latency
+        if NUMBA_AVAILABLE:
+            score_username_matches(['a'], ['b'])
+        
+        # Fast-path index of targets investigated in past runs
+        self._investigated = BloomFilter(self.config.output_dir / "investigated.bloom")
+
+        # setup() probes tool installs on disk; remember a successful pass
+        # so repeat calls within one process are free
+        self._setup_done = False
+
+        # Initialize tool integrations with a shared persistent result cache
+        self.result_cache = ResultCache(self.config.output_dir / "cache.db")
+        self.maigret = MaigretIntegration(self.config, self.logger, self.result_cache)
+        self.recon_ng = ReconNGIntegration(self.config, self.logger)
+        self.spiderfoot = SpiderFootIntegration(self.config, self.logger, self.result_cache)
+        
+        # Initialize utilities with API keys (with fallback)
+        if OSINTUtilities:
+            self.utilities = OSINTUtilities(self.config.api_keys)
+        else:
+            self.utilities = None
+            self.logger.warning("OSINTUtilities not available. Some features will be limited.")
+    
+    def setup(self) -> bool:
+        """Setup the OSINT environment"""
+        if self._setup_done:
+            return True
+        self.logger.info("Setting up OSINT environment...")
+
+        # Setup tools
+        tools_status = self.tool_manager.setup_tools()
+
+        # Check if all tools are ready
+        all_ready = all(tools_status.values())
+
+        if all_ready:
+            self._setup_done = True
+            self.logger.success("All OSINT tools are ready!")
+        else:
+            failed_tools = [tool for tool, status in tools_status.items() if not status]
+            self.logger.warning(f"Some tools failed to install: {', '.join(failed_tools)}")
+        
+        return all_ready
+    
+    def _load_previous_results(self, target: OSINTTarget) -> Optional[Dict]:
+        """Most recent saved investigation results for this target, or None"""
+        pattern = f"investigation_{target.slug}_*/investigation_results.json"
+        candidates = list(self.config.output_dir.glob(pattern))
+        candidates += self.config.output_dir.glob(f"run_*/{pattern}")
+        if not candidates:
+            return None
+        latest = max(candidates, key=lambda p: p.stat().st_mtime)
+        try:
+            with open(latest, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Could not load previous results from {latest}: {str(e)}")
+            return None
+
+    def investigate_target(self, target: OSINTTarget) -> Dict:
+        """Perform comprehensive OSINT investigation on target"""
+        # Constant-time duplicate check before any multi-minute tool runs;
+        # Bloom hits can be false positives, so the stored results must
+        # actually exist before short-circuiting
+        bloom_key = f"{target.full_name}|{target.email}"
+        if bloom_key in self._investigated:
+            previous = self._load_previous_results(target)
+            if previous is not None:
+                self.logger.info(f"Target already investigated, reusing results for: {target.full_name}")
+                return previous
+
+        self.logger.info(f"Starting OSINT investigation for: {target.full_name}")
+        
+        investigation_results = {
+            'target_info': {
+                'full_name': target.full_name,
+                'email': target.email,
+                'social_handles': target.social_handles,
+                'address': target.address,
+                'coordinates': target.coordinates
+            },
+            'maigret_results': {},
+            'recon_ng_results': {},
+            'spiderfoot_results': {},
+            'additional_intel': {},
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        # Create target-specific output directory under this run's prefix
+        target_output_dir = self._run_base / _run_name(f"investigation_{target.slug}")
+        target_output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Run Maigret for username enumeration (all variants in one invocation)
+        if target.username_variants:
+            self.logger.info("Running username enumeration with Maigret...")
+            maigret_results = self.maigret.search_usernames(
+                list(target.username_variants), target_output_dir)
+            if maigret_results and target.social_handles:
+                # Score each variant that produced results against the
+                # handles the user actually supplied and order the report
+                # best-match-first
+                found = list(maigret_results)
+                scores = score_username_matches(found, list(target.social_handles))
+                confidence = scores.max(axis=1)
+                order = np.argsort(-confidence, kind='stable')
+                maigret_results = {found[i]: maigret_results[found[i]]
+                                   for i in order}
+            investigation_results['maigret_results'].update(maigret_results)
+        
+        # Run Recon-ng for domain reconnaissance
+        if target.domain:
+            self.logger.info("Running domain reconnaissance with Recon-ng...")
+            workspace_name = _run_name("investigation")
+            recon_result = self.recon_ng.run_domain_recon(target.domain, workspace_name)
+            if recon_result:
+                investigation_results['recon_ng_results'] = recon_result
+        
+        # Run SpiderFoot for comprehensive scanning
+        scan_targets = []
+        if target.email:
+            scan_targets.append(target.email)
+        if target.domain:
+            scan_targets.append(target.domain)
+        
+        if scan_targets:
+            queue = []
+            for scan_target in scan_targets:
+                cached = self.spiderfoot.cached_result(scan_target)
+                if cached is not None:
+                    self.logger.info(f"Using cached SpiderFoot results for {scan_target}")
+                    investigation_results['spiderfoot_results'][scan_target] = cached
+                else:
+                    queue.append(scan_target)
+
+            # Launch scans as non-blocking child processes (output streams
+            # to disk) and reap them from this thread as they finish
+            running = {}
+            while queue or running:
+                while queue and len(running) < self.MAX_CONCURRENT_SPIDERFOOT:
+                    scan_target = queue.pop(0)
+                    handle = self.spiderfoot.start_scan(scan_target)
+                    if handle:
+                        running[scan_target] = (handle, time.time())
+
+                if not running:
+                    break
+
+                time.sleep(0.2)
+                for scan_target in list(running):
+                    handle, started = running[scan_target]
+                    proc = handle[0]
+                    if proc.poll() is None:
+                        if time.time() - started > self.spiderfoot.SCAN_TIMEOUT:
+                            self.logger.error(f"SpiderFoot scan timed out for {scan_target}")
+                            proc.kill()
+                            proc.wait()
+                        else:
+                            continue
+                    del running[scan_target]
+                    spiderfoot_result = self.spiderfoot.collect_scan(handle, scan_target)
+                    if spiderfoot_result:
+                        investigation_results['spiderfoot_results'][scan_target] = spiderfoot_result
+        
+        # Additional intelligence gathering using FREE utilities
+        additional_intel = {}
+        
+        if self.utilities:
+            # Domain analysis
+            if target.domain:
+                self.logger.info(f"Performing comprehensive domain analysis for: {target.domain}")
+                try:
+                    additional_intel['domain_analysis'] = self.utilities.comprehensive_domain_analysis(target.domain)
+                except Exception as e:
+                    self.logger.error(f"Domain analysis failed: {str(e)}")
+            
+            # Email investigation
+            if target.email:
+                self.logger.info(f"Investigating email: {target.email}")
+                try:
+                    additional_intel['email_investigation'] = self.utilities.email_investigation(target.email)
+                except Exception as e:
+                    self.logger.error(f"Email investigation failed: {str(e)}")
+            
+            # Social media search for usernames
+            if target.username_variants:
+                self.logger.info("Performing social media search...")
+                try:
+                    additional_intel['social_media_search'] = {}
+                    for username in target.username_variants[:3]:  # Limit to first 3 to avoid rate limiting
+                        additional_intel['social_media_search'][username] = self.utilities.social_media_search(username)
+                except Exception as e:
+                    self.logger.error(f"Social media search failed: {str(e)}")
+            
+            # Location analysis
+            if target.coordinates:
+                self.logger.info(f"Analyzing location: {target.coordinates}")
+                try:
+                    lat, lon = target.coordinates
+                    # Pass investigation results for interest-based filtering
+                    additional_intel['location_analysis'] = self.utilities.location_analysis(lat, lon, investigation_results)
+                except Exception as e:
+                    self.logger.error(f"Location analysis failed: {str(e)}")
+        else:
+            self.logger.warning("Additional intelligence features not available. Install missing dependencies.")
+        
+        investigation_results['additional_intel'] = additional_intel
+        
+        # Save investigation results; orjson encodes large result trees
+        # natively and writes UTF-8 bytes directly
+        results_file = target_output_dir / "investigation_results.json"
+        try:
+            if ORJSON_AVAILABLE:
+                with open(results_file, 'wb') as f:
+                    f.write(orjson.dumps(investigation_results, default=str,
+                                         option=orjson.OPT_INDENT_2))
+            else:
+                with open(results_file, 'w', encoding='utf-8') as f:
+                    json.dump(investigation_results, f, indent=2, default=str, ensure_ascii=False)
+            self.logger.success(f"Investigation completed. Results saved to: {results_file}")
+            self._investigated.add(bloom_key)
+            self._investigated.save()
+        except Exception as e:
+            self.logger.error(f"Failed to save results: {str(e)}")
+        
+        return investigation_results
+    
+    def generate_report(self, investigation_results: Dict,
+                        out=None) -> Optional[str]:
+        """Generate a human-readable report.
+
+        Writes incrementally to ``out`` (any object with ``write``) so large
+        reports never have to exist as one string; without ``out`` the report
+        is buffered and returned, as before.
+        """
+        buf = None
+        if out is None:
+            buf = out = io.StringIO()
+        # `w` is bound locally so each line costs one method call.
+        w = out.write
+        w(REPORT_HEADER_TMPL(
+            sep=SEP_EQ, ts=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        ))
+        w('\n')
+
+        # Target Information
+        target_info = investigation_results.get('target_info', {})
+        w(f"TARGET INFORMATION:\n"
+          f"{SEP_DASH}\n"
+          f"Full Name: {target_info.get('full_name', 'N/A')}\n"
+          f"Email: {target_info.get('email', 'N/A')}\n"
+          f"Social Handles: {', '.join(target_info.get('social_handles', []))}\n"
+          f"Address: {target_info.get('address', 'N/A')}\n"
+          f"Coordinates: {target_info.get('coordinates', 'N/A')}\n"
+          f"\n")
+
+        # Section dispatch: one lookup per section, renderers at module
+        # scope so absent sections cost nothing. The set intersection
+        # skips the per-section walk entirely for bare result dicts,
+        # while the table order keeps sections in report order.
+        present = investigation_results.keys() & _SECTION_KEYS
+        sections = [(title, render, data)
+                    for key, title, render in _REPORT_SECTIONS
+                    if key in present
+                    and (data := investigation_results[key])] if present else []
+        if _PARALLEL_RENDER and len(sections) > 1:
+            # Free-threaded build: render each section into its own buffer
+            # concurrently, then write them in report order
+            with ThreadPoolExecutor(max_workers=len(sections)) as exe:
+                for rendered in exe.map(_render_section_buffered, sections):
+                    w(rendered)
+        else:
+            for title, render, data in sections:
+                w(title)
+                w('\n')
+                w(SEP_DASH)
+                w('\n')
+                render(data, w)
+
+        w(SEP_EQ)
+        w("\nEND OF REPORT\n")
+        w(SEP_EQ)
+
+        return buf.getvalue() if buf is not None else None
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser; constructed once at import time"""
+    parser = argparse.ArgumentParser(description="Advanced OSINT Scraper")
+    parser.add_argument("--setup", action="store_true", help="Setup OSINT tools")
+    parser.add_argument("--name", help="Target's full name")
+    parser.add_argument("--email", help="Target's email address")
+    parser.add_argument("--social", nargs="*", help="Social media handles")
+    parser.add_argument("--address", help="Target's address")
+    parser.add_argument("--coordinates", nargs=2, type=float, help="Latitude and longitude")
+    parser.add_argument("--interactive", action="store_true", help="Interactive mode")
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def main():
+    """Main function"""
+    args = _PARSER.parse_args()
+    
+    # Initialize scraper
+    scraper = OSINTScraper()
+    
+    if args.setup:
+        scraper.setup()
+        return
+    
+    if args.interactive:
+        # Interactive mode
+        print(f"{Fore.CYAN}Welcome to Advanced OSINT Scraper{Style.RESET_ALL}")
+        print("Please provide target information:")
+        
+        full_name = input("Full Name: ").strip()
+        email = input("Email: ").strip()
+        
+        # One prompt for all handles instead of a sentinel-terminated loop
+        social_handles = [h.strip() for h in
+                          input("Social Media Handles (comma-separated, Enter to skip): ").split(',')
+                          if h.strip()]
+
+        address = input("Address: ").strip()
+
+        coord_input = input("Coordinates (lat,lon): ").strip()
+        coordinates = None
+        if coord_input:
+            match = _COORD_RE.match(coord_input)
+            if match:
+                coordinates = (float(match[1]), float(match[2]))
+            else:
+                print("Invalid coordinates format. Skipping...")
+        
+        target = OSINTTarget(full_name, email, social_handles, address, coordinates)
+    else:
+        # Command line mode
+        if not args.name and not args.email:
+            print("Error: At least name or email must be provided")
+            return
+        
+        coordinates = tuple(args.coordinates) if args.coordinates else None
+        target = OSINTTarget(
+            args.name or "",
+            args.email or "",
+            args.social or [],
+            args.address or "",
+            coordinates
+        )
+    
+    # Setup tools if not already done
+    if not scraper.setup():
+        print("Warning: Some tools may not be available. Continuing with available tools...")
+    
+    # Run investigation
+    results = scraper.investigate_target(target)
+    
+    # Stream the report to disk and tee it to stdout, so it is never
+    # materialized as one string; the wide buffer amortizes write syscalls
+    report_file = scraper.config.output_dir / f"{_run_name('report_' + target.slug)}.txt"
+    tmp_file = report_file.with_suffix('.txt.tmp')
+    try:
+        # Write to a sibling tempfile and rename into place, so a crash
+        # mid-write never leaves a truncated report behind
+        with open(tmp_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            w = sys.stdout.write
+            w('\n')
+            scraper.generate_report(results, _Tee(sys.stdout, f))
+            w('\n')
+            sys.stdout.flush()
+        os.replace(tmp_file, report_file)
+        print(f"\n{Fore.GREEN}Report saved to: {report_file}{Style.RESET_ALL}")
+    except Exception as e:
+        print(f"\n{Fore.RED}Failed to save report: {str(e)}{Style.RESET_ALL}")
+
+if __name__ == "__main__":
+    main()
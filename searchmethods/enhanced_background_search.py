@@ -8,7 +8,7 @@ import logging
 import time
 import requests
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from urllib.parse import quote_plus
 import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -33,20 +33,16 @@ from datetime import datetime
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# slots halve the per-instance memory (no __dict__) and frozen instances
+# are safe to share across the search worker threads
+@dataclass(slots=True, frozen=True)
 class UserProfile:
     """Enhanced user profile data structure"""
     name: str
     location: str = ""
-    social_handles: Dict[str, str] = None
+    social_handles: Dict[str, str] = field(default_factory=dict)
     activity: str = ""
-    interests: List[str] = None
-
-    def __post_init__(self):
-        if self.social_handles is None:
-            self.social_handles = {}
-        if self.interests is None:
-            self.interests = []
+    interests: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -9,18 +9,142 @@ This module provides comprehensive location detection using multiple methods:
 - Privacy-focused implementation with opt-in features
 """
 
+import asyncio
 import requests
 import logging
+import math
+import os
+import sqlite3
+import threading
 import time
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import json
 from datetime import datetime, timedelta
 
+from config.settings import CACHE_DIR
+from services.http_session import get_shared_session
+
+# Optional async HTTP client for batch geocoding fan-out
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    aiohttp = None
+
 logger = logging.getLogger(__name__)
 
 
+class _AsyncRateLimiter:
+    """Spaces coroutine starts so upstream rate policies are respected"""
+
+    def __init__(self, min_delay: float):
+        self.min_delay = min_delay
+        self._lock = asyncio.Lock()
+        self._last = 0.0
+
+    async def wait(self):
+        """Block until at least min_delay has passed since the last start"""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            wait_for = self._last + self.min_delay - now
+            if wait_for > 0:
+                await asyncio.sleep(wait_for)
+                now = loop.time()
+            self._last = now
+
+
+# Reverse geocoding is deterministic for a given coordinate, so results are
+# cached at two layers: an in-process lru_cache answering repeats in
+# microseconds, backed by a small SQLite table that survives restarts.
+# Keys quantize coordinates to 5 decimals (~1m); entries expire after 30
+# days to respect the provider's terms of service.
+_REVGEO_TTL_SECONDS = 30 * 86400
+_revgeo_conn = None
+_revgeo_lock = threading.Lock()
+
+
+class _ReverseGeocodeFailed(Exception):
+    """Raised on lookup failure so lru_cache never memoizes a miss"""
+
+
+def _revgeo_db() -> sqlite3.Connection:
+    """Open (once) the on-disk reverse geocoding cache"""
+    global _revgeo_conn
+    with _revgeo_lock:
+        if _revgeo_conn is None:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                os.fspath(CACHE_DIR / 'revgeo.db'), check_same_thread=False
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS revgeo '
+                '(key TEXT PRIMARY KEY, payload TEXT, stored_at REAL)'
+            )
+            conn.commit()
+            _revgeo_conn = conn
+    return _revgeo_conn
+
+
+# Zoom-18 Web-Mercator tiles are ~150m across -- about a city block, the
+# granularity at which reverse-geocoded address fields actually change
+_TILE_ZOOM = 18
+
+# Web-Mercator projection is undefined at the poles
+_MERCATOR_LAT_LIMIT = 85.05112878
+
+
+def _tile_key(lat: float, lon: float, zoom: int = _TILE_ZOOM) -> Tuple[int, int]:
+    """Web-Mercator tile containing (lat, lon) at the given zoom"""
+    lat = max(min(lat, _MERCATOR_LAT_LIMIT), -_MERCATOR_LAT_LIMIT)
+    n = 1 << zoom
+    tile_x = int((lon + 180.0) / 360.0 * n)
+    lat_rad = math.radians(lat)
+    tile_y = int((1.0 - math.log(math.tan(lat_rad) + 1.0 / math.cos(lat_rad)) / math.pi) / 2.0 * n)
+    return tile_x, tile_y
+
+
+def _tile_center(tile_x: int, tile_y: int, zoom: int = _TILE_ZOOM) -> Tuple[float, float]:
+    """Latitude/longitude at the center of a Web-Mercator tile"""
+    n = 1 << zoom
+    lon = (tile_x + 0.5) / n * 360.0 - 180.0
+    lat = math.degrees(math.atan(math.sinh(math.pi * (1.0 - 2.0 * (tile_y + 0.5) / n))))
+    return lat, lon
+
+
+def _revgeo_disk_get(key: str) -> Optional[Dict[str, Any]]:
+    """Fetch a fresh cached payload from disk, or None"""
+    try:
+        conn = _revgeo_db()
+        with _revgeo_lock:
+            row = conn.execute(
+                'SELECT payload, stored_at FROM revgeo WHERE key = ?', (key,)
+            ).fetchone()
+        if row and time.time() - row[1] <= _REVGEO_TTL_SECONDS:
+            return json.loads(row[0])
+    except Exception as e:
+        logger.debug(f"Reverse geocode disk cache read failed: {e}")
+    return None
+
+
+def _revgeo_disk_put(key: str, payload: Dict[str, Any]) -> None:
+    """Persist a reverse geocoding payload to disk"""
+    try:
+        conn = _revgeo_db()
+        with _revgeo_lock:
+            conn.execute(
+                'INSERT OR REPLACE INTO revgeo (key, payload, stored_at) VALUES (?, ?, ?)',
+                (key, json.dumps(payload), time.time())
+            )
+            conn.commit()
+    except Exception as e:
+        logger.debug(f"Reverse geocode disk cache write failed: {e}")
+
+
 @dataclass
 class LocationResult:
     """Structured location data with confidence scoring"""
@@ -60,16 +184,40 @@ class LocationResult:
 class IPLocationProvider:
     """Base class for IP-based location providers"""
 
+    # Per-provider result cache: repeat lookups for the same IP skip the
+    # HTTP round-trip entirely for a day (mirrors a 24h geoip cache)
+    CACHE_MAX_SIZE = 4096
+    CACHE_TTL = timedelta(hours=24)
+
     def __init__(self, name: str, timeout: int = 5):
         self.name = name
         self.timeout = timeout
         self.last_request_time = 0
         self.min_delay = 1.0  # Rate limiting
+        self._cache = {}
+        self.session = get_shared_session()
 
     def get_location(self, ip_address: str) -> Optional[LocationResult]:
         """Get location from IP address"""
         raise NotImplementedError
 
+    def get_location_cached(self, ip_address: str) -> Optional[LocationResult]:
+        """Get location from IP address, serving repeats from the TTL cache"""
+        cached = self._cache.get(ip_address)
+        if cached:
+            result, cached_time = cached
+            if datetime.now() - cached_time < self.CACHE_TTL:
+                return result
+            del self._cache[ip_address]
+
+        result = self.get_location(ip_address)
+        if result:
+            if len(self._cache) >= self.CACHE_MAX_SIZE:
+                # Drop the oldest entry (insertion order) to bound memory
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[ip_address] = (result, datetime.now())
+        return result
+
     def _rate_limit(self):
         """Simple rate limiting"""
         current_time = time.time()
@@ -98,7 +246,7 @@ class IPStackProvider(IPLocationProvider):
                 'fields': 'country_name,country_code,region_name,region_code,city,zip,latitude,longitude,time_zone,continent_name'
             }
 
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
 
             data = response.json()
@@ -145,7 +293,7 @@ class IP2LocationProvider(IPLocationProvider):
                 'fields': 'status,country,countryCode,region,regionName,city,zip,lat,lon,timezone,continent,query'
             }
 
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
 
             data = response.json()
@@ -188,7 +336,7 @@ class FreeGeoIPProvider(IPLocationProvider):
 
             url = f"{self.base_url}/{ip_address}"
 
-            response = requests.get(url, timeout=self.timeout)
+            response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
 
             data = response.json()
@@ -238,8 +386,17 @@ class EnhancedLocationService:
             FreeGeoIPProvider()
         ])
 
+        # Provider set is fixed after init; precompute what diagnostics ask
+        # for on every hit instead of rescanning the provider list
+        self.provider_names = frozenset(p.name for p in self.providers)
+        self.provider_count = len(self.providers)
+
         self.cache = {}
         self.cache_ttl = timedelta(hours=1)  # Cache IP locations for 1 hour
+        self.session = get_shared_session()
+
+        # In-process memo over the disk-backed reverse geocoding lookup
+        self._revgeo_cached = lru_cache(maxsize=100_000)(self._reverse_geocode_tile)
 
         logger.info(f"Enhanced location service initialized with {len(self.providers)} providers")
 
@@ -254,7 +411,7 @@ class EnhancedLocationService:
 
         for service in ip_services:
             try:
-                response = requests.get(service, timeout=3)
+                response = self.session.get(service, timeout=3)
                 response.raise_for_status()
 
                 data = response.json()
@@ -317,15 +474,22 @@ class EnhancedLocationService:
                 logger.info(f"Using cached location for IP {ip_address}")
                 return cached_result
 
-        # Try all providers concurrently
+        # Race all providers concurrently: the first sufficiently accurate
+        # answer wins and the remaining lookups are cancelled, so latency is
+        # close to min(providers) rather than the sum of their timeouts
         results = []
+        best_result = None
+
+        # No context manager here: `with` would call shutdown(wait=True) on
+        # exit and join every provider thread, blocking on the slowest one
+        # even after a confident result arrived
+        executor = ThreadPoolExecutor(max_workers=len(self.providers))
+        future_to_provider = {
+            executor.submit(provider.get_location_cached, ip_address): provider
+            for provider in self.providers
+        }
 
-        with ThreadPoolExecutor(max_workers=len(self.providers)) as executor:
-            future_to_provider = {
-                executor.submit(provider.get_location, ip_address): provider
-                for provider in self.providers
-            }
-
+        try:
             for future in as_completed(future_to_provider, timeout=10):
                 provider = future_to_provider[future]
                 try:
@@ -333,15 +497,24 @@ class EnhancedLocationService:
                     if result:
                         results.append(result)
                         logger.info(f"Provider {provider.name} returned location: {result.city}, {result.state}")
+
+                        if result.accuracy >= 0.75:
+                            best_result = result
+                            break
                 except Exception as e:
                     logger.warning(f"Provider {provider.name} failed: {e}")
+        finally:
+            # Return without waiting for stragglers; their threads finish
+            # (and populate their own caches) in the background
+            executor.shutdown(wait=False, cancel_futures=True)
 
         if not results:
             logger.error("All location providers failed")
             return None
 
-        # Select best result based on accuracy and validate consistency
-        best_result = self._select_best_location(results)
+        if best_result is None:
+            # Only low-confidence answers came back; pick the most consistent
+            best_result = self._select_best_location(results)
 
         # Cache the result
         self.cache[cache_key] = (best_result, datetime.now())
@@ -447,7 +620,44 @@ class EnhancedLocationService:
 
     def _reverse_geocode_coordinates(self, lat: float, lon: float) -> Optional[Dict[str, Any]]:
         """
-        Reverse geocode coordinates to get address information
+        Reverse geocode coordinates, serving repeats from the two-layer cache
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            Location dictionary or None if failed
+        """
+        try:
+            # Tile bucketing: every coordinate on the same ~150m Web-Mercator
+            # tile shares one entry, so nearby clicks become cache hits
+            return self._revgeo_cached(*_tile_key(lat, lon))
+        except _ReverseGeocodeFailed:
+            return None
+
+    def _reverse_geocode_tile(self, tile_x: int, tile_y: int) -> Dict[str, Any]:
+        """Disk-cache wrapper around the network fetch; raises on failure
+
+        The fetch uses the tile's center coordinates; a zoom-18 tile spans
+        one city block, within the precision of street/city/country fields.
+        """
+        key = f"tile{_TILE_ZOOM}:{tile_x}:{tile_y}"
+        cached = _revgeo_disk_get(key)
+        if cached is not None:
+            return cached
+
+        lat, lon = _tile_center(tile_x, tile_y)
+        result = self._reverse_geocode_fetch(lat, lon)
+        if result is None:
+            # Raising keeps failures out of both cache layers
+            raise _ReverseGeocodeFailed(key)
+        _revgeo_disk_put(key, result)
+        return result
+
+    def _reverse_geocode_fetch(self, lat: float, lon: float) -> Optional[Dict[str, Any]]:
+        """
+        Reverse geocode coordinates against the upstream provider
 
         Args:
             lat: Latitude
@@ -468,7 +678,7 @@ class EnhancedLocationService:
             }
 
             headers = {'User-Agent': 'WhatNowAI/1.0 Enhanced Location Service'}
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = self.session.get(url, params=params, headers=headers, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -538,7 +748,7 @@ class EnhancedLocationService:
             }
 
             headers = {'User-Agent': 'WhatNowAI/1.0 Enhanced Location Service'}
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = self.session.get(url, params=params, headers=headers, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -568,6 +778,97 @@ class EnhancedLocationService:
             logger.error(f"Address geocoding failed for '{address}': {e}")
             return None
 
+    async def async_geocode(self, session: 'aiohttp.ClientSession', address: str,
+                            rate_limiter: Optional[_AsyncRateLimiter] = None) -> Optional[LocationResult]:
+        """
+        Geocode one address over a shared aiohttp session
+
+        Args:
+            session: Shared aiohttp client session
+            address: Address string to geocode
+            rate_limiter: Optional limiter spacing requests to the provider
+
+        Returns:
+            LocationResult or None if geocoding failed
+        """
+        try:
+            if rate_limiter is not None:
+                await rate_limiter.wait()
+
+            params = {
+                'q': address,
+                'format': 'json',
+                'limit': 1,
+                'addressdetails': 1
+            }
+            headers = {'User-Agent': 'WhatNowAI/1.0 Enhanced Location Service'}
+
+            async with session.get(
+                "https://nominatim.openstreetmap.org/search",
+                params=params,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
+
+            if data:
+                result = data[0]
+                address_details = result.get('address', {})
+
+                return LocationResult(
+                    latitude=float(result['lat']),
+                    longitude=float(result['lon']),
+                    city=(address_details.get('city') or address_details.get('town') or
+                          address_details.get('village') or ''),
+                    state=(address_details.get('state') or address_details.get('county') or ''),
+                    country=address_details.get('country', ''),
+                    country_code=address_details.get('country_code', '').upper(),
+                    zip_code=address_details.get('postcode', ''),
+                    timezone='',  # Not provided by Nominatim
+                    accuracy=0.8,
+                    source='nominatim_geocoding',
+                    continent='',
+                    region_code=''
+                )
+
+            return None
+
+        except Exception as e:
+            logger.error(f"Async geocoding failed for '{address}': {e}")
+            return None
+
+    async def _geocode_batch(self, addresses: List[str]) -> List[Optional[LocationResult]]:
+        """Fan out a batch of geocoding lookups over one pooled session"""
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=4)
+        rate_limiter = _AsyncRateLimiter(min_delay=1.0)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(
+                *(self.async_geocode(session, address, rate_limiter) for address in addresses),
+                return_exceptions=True
+            )
+        return [result if isinstance(result, LocationResult) else None for result in results]
+
+    def geocode_addresses(self, addresses: List[str]) -> List[Optional[LocationResult]]:
+        """
+        Geocode a batch of addresses concurrently
+
+        The network round-trips overlap instead of running back to back, so
+        the batch completes in roughly the slowest lookup plus rate-limit
+        spacing. Falls back to sequential lookups without aiohttp.
+
+        Args:
+            addresses: Address strings to geocode
+
+        Returns:
+            Results aligned with the input order; failed lookups are None
+        """
+        if not addresses:
+            return []
+        if not AIOHTTP_AVAILABLE:
+            return [self.get_location_for_address(address) for address in addresses]
+        return asyncio.run(self._geocode_batch(addresses))
+
 
 # Global instance with configurable API key
 def create_location_service(ipstack_key: str = None) -> EnhancedLocationService:
@@ -4,6 +4,7 @@ Provides alternative event discovery methods when primary APIs fail
 """
 import logging
 import requests
+from services.http_session import get_shared_session
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
@@ -20,10 +21,12 @@ class FallbackEventService:
     """
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = get_shared_session()
+        # Per-request headers; the shared session is used by other services
+        # so its defaults must not be mutated here
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        }
         
     def search_events(self, 
                      latitude: float, 
@@ -87,7 +90,7 @@ class FallbackEventService:
             base_url = "https://www.eventbrite.com/d/events/"
             params = f"?lat={lat}&lng={lon}&radius={radius}"
             
-            response = self.session.get(base_url + params, timeout=10)
+            response = self.session.get(base_url + params, headers=self.headers, timeout=10)
             soup = BeautifulSoup(response.text, 'html.parser')
             
             # Extract events (structure may vary)
@@ -156,7 +159,7 @@ class FallbackEventService:
         
         try:
             url = f"https://www.meetup.com/find/?location={lat}%2C{lon}&source=EVENTS"
-            response = self.session.get(url, timeout=10)
+            response = self.session.get(url, headers=self.headers, timeout=10)
             
             # Basic parsing - actual structure may vary
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -6,6 +6,7 @@ including reverse geocoding for converting coordinates to address information.
 Privacy-focused implementation with configurable timeouts and user agents.
 """
 import requests
+from services.http_session import get_shared_session
 import logging
 from typing import Dict, Optional
 
@@ -24,6 +25,7 @@ class GeocodingService:
         """
         self.user_agent = user_agent
         self.base_url = "https://nominatim.openstreetmap.org/reverse"
+        self.session = get_shared_session()
 
     def reverse_geocode(self, latitude: float, longitude: float) -> Optional[Dict]:
         """
@@ -49,7 +51,7 @@ class GeocodingService:
                 'User-Agent': self.user_agent
             }
 
-            response = requests.get(
+            response = self.session.get(
                 self.base_url,
                 params=params,
                 headers=headers,
@@ -132,7 +134,7 @@ class GeocodingService:
             }
 
             headers = {'User-Agent': self.user_agent}
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = self.session.get(url, params=params, headers=headers, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -0,0 +1,37 @@
+"""
+Shared HTTP session with connection pooling
+
+Services that talk to external APIs reuse one pooled `requests.Session`
+so TCP and TLS handshakes are amortized across requests instead of paid
+on every call.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Pool sizing, exported so diagnostics endpoints can report reuse settings
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 50
+
+
+def _build_session() -> requests.Session:
+    """Build the shared session with pooled adapters and light retries"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Module-level singleton; requests.Session is thread-safe for requests
+SHARED_SESSION = _build_session()
+
+
+def get_shared_session() -> requests.Session:
+    """Return the process-wide pooled session"""
+    return SHARED_SESSION
@@ -6,6 +6,7 @@ including IP-based geolocation, browser geolocation APIs, and fallback methods.
 """
 
 import requests
+from services.http_session import get_shared_session
 import logging
 import json
 from typing import Dict, Optional, List, Tuple
@@ -23,6 +24,7 @@ class LocationDetectionService:
         """Initialize the location detection service"""
         self.timeout = 5
         self.user_agent = "WhatNowAI/1.0 (Location Detection Service)"
+        self.session = get_shared_session()
         
         # Multiple IP geolocation services as fallbacks
         self.ip_services = [
@@ -108,7 +110,7 @@ class LocationDetectionService:
                 elif service['name'] == 'freeipapi':
                     url = f"{url}{ip_address}"
                     
-                response = requests.get(
+                response = self.session.get(
                     url,
                     headers={'User-Agent': self.user_agent},
                     timeout=self.timeout
@@ -132,12 +134,12 @@ class LocationDetectionService:
         try:
             # Get public IP if not provided
             if not ip_address:
-                ip_response = requests.get('https://api.ipify.org', timeout=self.timeout)
+                ip_response = self.session.get('https://api.ipify.org', timeout=self.timeout)
                 ip_address = ip_response.text.strip()
             
             # Use different service for geolocation
             geo_url = f"https://freegeoip.app/json/{ip_address}"
-            response = requests.get(geo_url, timeout=self.timeout)
+            response = self.session.get(geo_url, timeout=self.timeout)
             
             if response.status_code == 200:
                 data = response.json()
@@ -164,7 +166,7 @@ class LocationDetectionService:
         
         for service_url in fallback_services:
             try:
-                response = requests.get(service_url, timeout=self.timeout)
+                response = self.session.get(service_url, timeout=self.timeout)
                 if response.status_code == 200:
                     data = response.json()
                     
@@ -201,7 +203,7 @@ class LocationDetectionService:
         
         for service in ip_services:
             try:
-                response = requests.get(service, timeout=self.timeout)
+                response = self.session.get(service, timeout=self.timeout)
                 if response.status_code == 200:
                     ip = response.text.strip()
                     if self._validate_ip(ip):
@@ -280,7 +282,7 @@ class LocationDetectionService:
         # Try each service independently
         for service in self.ip_services:
             try:
-                response = requests.get(
+                response = self.session.get(
                     service['url'],
                     headers={'User-Agent': self.user_agent},
                     timeout=self.timeout
@@ -11,6 +11,8 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 import json
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,23 +58,29 @@ class MapMarker:
         }
 
 
-class MappingService:
-    """Service for aggregating events from multiple APIs and displaying on a map"""
-    
+class MarkerSet:
+    """
+    A self-contained batch of markers built for one request
+
+    Each request builds its own MarkerSet, so concurrent requests never
+    mutate shared state; the finished set is published to the service
+    afterwards for read-only consumers like /map/search.
+    """
+
     def __init__(self, config: Dict[str, Any]):
         """
-        Initialize mapping service
-        
+        Initialize an empty marker set
+
         Args:
             config: Configuration dictionary
         """
         self.config = config
         self.markers = []
-        
+
     def clear_markers(self):
         """Clear all markers"""
         self.markers = []
-    
+
     def add_ticketmaster_events(self, events: List[Any]):
         """Add events from Ticketmaster to the map"""
         for event in events:
@@ -172,36 +180,69 @@ class MappingService:
                 logger.warning(f"Failed to parse Meetup event: {e}")
                 continue
     
+    def _build_generic_marker(self, event: Dict[str, Any], source: str) -> MapMarker:
+        """Build a MapMarker from a generic event dictionary"""
+        return MapMarker(
+            id=event.get('id', f"{source}_{hash(event.get('name', ''))}"),
+            name=event.get('name', 'Unknown Event'),
+            latitude=float(event.get('latitude', 0)),
+            longitude=float(event.get('longitude', 0)),
+            category=event.get('category', 'miscellaneous'),
+            subcategory=event.get('subcategory', ''),
+            description=event.get('description', ''),
+            url=event.get('url', ''),
+            date=event.get('date', ''),
+            time=event.get('time', ''),
+            venue=event.get('venue', ''),
+            address=event.get('address', ''),
+            price_min=event.get('price_min'),
+            price_max=event.get('price_max'),
+            image_url=event.get('image_url', ''),
+            source=source
+        )
+
     def add_generic_event(self, event: Dict[str, Any], source: str = 'unknown'):
         """Add a generic event from dictionary format to the map"""
         try:
-            marker = MapMarker(
-                id=event.get('id', f"{source}_{hash(event.get('name', ''))}"),
-                name=event.get('name', 'Unknown Event'),
-                latitude=float(event.get('latitude', 0)),
-                longitude=float(event.get('longitude', 0)),
-                category=event.get('category', 'miscellaneous'),
-                subcategory=event.get('subcategory', ''),
-                description=event.get('description', ''),
-                url=event.get('url', ''),
-                date=event.get('date', ''),
-                time=event.get('time', ''),
-                venue=event.get('venue', ''),
-                address=event.get('address', ''),
-                price_min=event.get('price_min'),
-                price_max=event.get('price_max'),
-                image_url=event.get('image_url', ''),
-                source=source
-            )
-            
+            marker = self._build_generic_marker(event, source)
+
             if marker.latitude and marker.longitude:
                 self.markers.append(marker)
                 logger.debug(f"Added {source} event: {marker.name}")
             else:
                 logger.warning(f"Skipping event without valid coordinates: {event.get('name', 'Unknown')}")
-                
+
         except Exception as e:
             logger.warning(f"Failed to parse generic event: {e}")
+
+    def add_generic_events(self, events: List[Dict[str, Any]], source: str = 'unknown'):
+        """
+        Add a batch of generic events in one call
+
+        Builds all markers first and extends the store once; parse failures
+        and events without coordinates are tallied into a single warning
+        instead of one log line per event.
+        """
+        markers = []
+        failed = 0
+        skipped = 0
+        for event in events:
+            try:
+                marker = self._build_generic_marker(event, source)
+            except Exception:
+                failed += 1
+                continue
+            if marker.latitude and marker.longitude:
+                markers.append(marker)
+            else:
+                skipped += 1
+
+        self.markers.extend(markers)
+        if failed or skipped:
+            logger.warning(
+                f"Batch add of {len(events)} {source} events: "
+                f"{failed} failed to parse, {skipped} missing coordinates"
+            )
     
     def add_custom_locations(self, locations: List[Dict[str, Any]]):
         """Add custom locations to the map"""
@@ -345,5 +386,102 @@ class MappingService:
                 query_lower in marker.venue.lower() or
                 query_lower in marker.category.lower()):
                 matching_markers.append(marker)
-        
+
         return matching_markers
+
+    def get_markers_soa(self, query: str) -> Dict[str, Any]:
+        """
+        Search markers and return them in structure-of-arrays form
+
+        Parallel arrays avoid building one dict per marker and let the
+        coordinate columns be serialized (and later distance-filtered)
+        as NumPy arrays instead of per-element Python objects.
+
+        Args:
+            query: Search query string
+
+        Returns:
+            Dictionary of parallel arrays: id, name, category, venue, url
+            as lists and lat/lon as NumPy float64 arrays
+        """
+        matching = self.search_markers(query)
+        count = len(matching)
+        return {
+            'id': [marker.id for marker in matching],
+            'name': [marker.name for marker in matching],
+            'lat': np.fromiter((marker.latitude for marker in matching), dtype=np.float64, count=count),
+            'lon': np.fromiter((marker.longitude for marker in matching), dtype=np.float64, count=count),
+            'category': [marker.category for marker in matching],
+            'venue': [marker.venue for marker in matching],
+            'url': [marker.url for marker in matching]
+        }
+
+
+class MappingService:
+    """
+    Stateless facade for building and publishing per-request marker sets
+
+    build_markers constructs a fresh MarkerSet without touching shared
+    state, so concurrent requests can run it freely; publish() then swaps
+    the finished set in with a single reference assignment (atomic under
+    the GIL) - classic double-buffering, no lock required. Read-only
+    consumers always see the most recently published complete set.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize mapping service
+
+        Args:
+            config: Configuration dictionary
+        """
+        self.config = config
+        self._current = MarkerSet(config)
+
+    def build_markers(self, ticketmaster_events: Optional[List[Any]] = None,
+                      fallback_events: Optional[List[Dict[str, Any]]] = None) -> MarkerSet:
+        """
+        Build a fresh MarkerSet from the given event batches
+
+        Args:
+            ticketmaster_events: Events from the Ticketmaster service
+            fallback_events: Generic event dictionaries from fallback sources
+
+        Returns:
+            A new MarkerSet private to the caller
+        """
+        marker_set = MarkerSet(self.config)
+        if ticketmaster_events:
+            marker_set.add_ticketmaster_events(ticketmaster_events)
+        if fallback_events:
+            marker_set.add_generic_events(fallback_events, source='fallback')
+        return marker_set
+
+    def publish(self, marker_set: MarkerSet):
+        """Atomically swap in a finished marker set for read-only consumers"""
+        self._current = marker_set
+
+    @property
+    def current(self) -> MarkerSet:
+        """The most recently published marker set"""
+        return self._current
+
+    def get_markers_soa(self, query: str) -> Dict[str, Any]:
+        """Search the published marker set in structure-of-arrays form"""
+        return self._current.get_markers_soa(query)
+
+    def search_markers(self, query: str) -> List[MapMarker]:
+        """Search the published marker set"""
+        return self._current.search_markers(query)
+
+    def get_all_markers(self) -> List[MapMarker]:
+        """Get all markers in the published set"""
+        return self._current.get_all_markers()
+
+    def get_category_stats(self) -> Dict[str, int]:
+        """Get category statistics for the published set"""
+        return self._current.get_category_stats()
+
+    def add_generic_event(self, event: Dict[str, Any], source: str = 'unknown'):
+        """Add a single event to the published set (test/demo convenience)"""
+        self._current.add_generic_event(event, source)
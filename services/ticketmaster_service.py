@@ -8,6 +8,7 @@ event discovery that adapts to user preferences and behavioral patterns.
 """
 
 import requests
+from services.http_session import get_shared_session
 import logging
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
@@ -99,7 +100,7 @@ class TicketmasterService:
         self.api_key = api_key
         self.config = config
         self.base_url = config.get('BASE_URL', 'https://app.ticketmaster.com/discovery/v2')
-        self.session = requests.Session()
+        self.session = get_shared_session()
         
         # Enhanced personalization components
         self.category_mapper = self._init_category_mapper()
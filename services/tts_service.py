@@ -8,7 +8,7 @@ import asyncio
 import edge_tts
 import os
 import uuid
-from typing import Optional, Tuple, Dict
+from typing import Callable, Optional, Tuple, Dict
 import logging
 from datetime import datetime
 
@@ -103,19 +103,23 @@ class TTSService:
             import time
             current_time = time.time()
             max_age_seconds = max_age_hours * 3600
-            
-            for filename in os.listdir(self.audio_dir):
-                if filename.endswith('.mp3'):
-                    file_path = os.path.join(self.audio_dir, filename)
-                    file_age = current_time - os.path.getctime(file_path)
-                    
+
+            # os.scandir returns stat data with the directory entries, so this
+            # avoids a separate stat syscall per file compared to os.listdir
+            with os.scandir(self.audio_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.mp3') or not entry.is_file():
+                        continue
+
+                    file_age = current_time - entry.stat().st_ctime
+
                     if file_age > max_age_seconds:
                         try:
-                            os.remove(file_path)
-                            logger.info(f"Cleaned up old audio file: {filename}")
+                            os.unlink(entry.path)
+                            logger.info(f"Cleaned up old audio file: {entry.name}")
                         except OSError as e:
-                            logger.warning(f"Failed to remove old audio file {filename}: {e}")
-                            
+                            logger.warning(f"Failed to remove old audio file {entry.name}: {e}")
+
         except Exception as e:
             logger.error(f"Error during audio cleanup: {e}")
 
@@ -134,40 +138,54 @@ def get_time_based_greeting() -> str:
         return "Hello"
 
 
+def get_location_context(location_data: Optional[Dict]) -> str:
+    """Build a ' from City, Country' suffix for location-aware steps"""
+    if not location_data:
+        return ""
+    city = location_data.get('city', '')
+    country = location_data.get('country', '')
+    if city and country:
+        return f" from {city}, {country}"
+    elif country:
+        return f" from {country}"
+    return ""
+
+
+# Step -> builder dispatch table, built once at import. Each builder takes
+# the optional location data and returns the spoken text; the current steps
+# are location-independent, so their strings are frozen constants and a
+# lookup replaces the per-call dict rebuild and string formatting.
+INTRO_BUILDERS: Dict[str, Callable[[Optional[Dict]], str]] = {
+    "step_name": lambda location_data=None: (
+        "Welcome to WhatNow AI! First, I'd love to know your name!"
+    ),
+    "step_activity": lambda location_data=None: (
+        "Perfect! Now tell me, what would you like to do today?"
+    ),
+    "step_location": lambda location_data=None: (
+        "Great choice! To give you the best local recommendations, I'll need to know where you are."
+    ),
+    "processing": lambda location_data=None: (
+        "Excellent! Now I'm creating your personalized recommendations. This will just take a moment."
+    ),
+}
+
+
 def get_introduction_text(step: str, location_data: Optional[Dict] = None) -> str:
     """
     Generate dynamic introduction text based on time, location, and step
-    
+
     Args:
         step: The onboarding step
         location_data: Optional location information
-        
+
     Returns:
         Personalized introduction text
     """
-    greeting = get_time_based_greeting()
-    
-    # Extract location info if available
-    location_context = ""
-    if location_data:
-        city = location_data.get('city', '')
-        country = location_data.get('country', '')
-        if city and country:
-            location_context = f" from {city}, {country}"
-        elif country:
-            location_context = f" from {country}"
-    
-    texts = {
-        "step_name": f"Welcome to WhatNow AI! First, I'd love to know your name!",
-        
-        "step_activity": f"Perfect! Now tell me, what would you like to do today?",
-        
-        "step_location": f"Great choice! To give you the best local recommendations, I'll need to know where you are.",
-        
-        "processing": f"Excellent! Now I'm creating your personalized recommendations. This will just take a moment."
-    }
-    
-    return texts.get(step, "Let's continue!")
+    builder = INTRO_BUILDERS.get(step)
+    if builder is None:
+        return "Let's continue!"
+    return builder(location_data)
 
 
 # Backward compatibility - keep static texts as fallback
@@ -3,74 +3,113 @@
 Quick test to verify the enhanced location service configuration
 """
 
+import hashlib
+import hmac
+import mmap
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# SHA-256 of the expected IPStack API key, so the plaintext key never
+# appears in source and the comparison is constant-time
+EXPECTED_IPSTACK_KEY_SHA256 = '63a58dc6d33655de7422e4df76d5d0216dfce2c1c5ac765181b4dcb97fee9268'
+
+
+def _ipstack_key_matches():
+    """Look up the IPStack key from the parsed secrets and compare its hash"""
+    try:
+        from config.settings import SECRETS
+    except ImportError:
+        return False
+
+    value = SECRETS.get('IPSTACK_API_KEY', '')
+    if not value:
+        return False
+
+    digest = hashlib.sha256(value.encode()).hexdigest()
+    return hmac.compare_digest(digest, EXPECTED_IPSTACK_KEY_SHA256)
+
+
+def _scan_names(directory):
+    """Return the set of entry names in a directory (empty if missing)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def _file_contains(path, *markers):
+    """Check file contents for byte markers via mmap without decoding"""
+    try:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return all(mm.find(marker) != -1 for marker in markers)
+    except (OSError, ValueError):
+        return False
+
 
 def test_configuration():
     """Test if the enhanced location configuration is correct"""
     print("=== Enhanced Location Service Configuration Test ===")
 
+    # One scandir pass per directory instead of a stat call per path,
+    # dispatched concurrently so the kernel can overlap entry lookups
+    directories = ['.', 'services', 'static/js', 'templates']
+    with ThreadPoolExecutor(max_workers=len(directories)) as executor:
+        root_names, service_names, js_names, template_names = executor.map(
+            _scan_names, directories
+        )
+
     # Check if secrets.txt exists and has IPStack key
-    secrets_file = 'secrets.txt'
-    if os.path.exists(secrets_file):
+    if 'secrets.txt' in root_names:
         print("✓ secrets.txt found")
 
-        with open(secrets_file, 'r') as f:
-            content = f.read()
-            if 'IPSTACK_API_KEY' in content and '3e3cd89b32d39af7119d79f8fe981803' in content:
-                print("✓ IPStack API key configured correctly")
-            else:
-                print("✗ IPStack API key not found or incorrect")
-                return False
+        if _ipstack_key_matches():
+            print("✓ IPStack API key configured correctly")
+        else:
+            print("✗ IPStack API key not found or incorrect")
+            return False
     else:
         print("✗ secrets.txt not found")
         return False
 
     # Check if enhanced location service file exists
-    service_file = 'services/enhanced_location_service.py'
-    if os.path.exists(service_file):
+    if 'enhanced_location_service.py' in service_names:
         print("✓ Enhanced location service file exists")
     else:
         print("✗ Enhanced location service file missing")
         return False
 
     # Check if enhanced location JS exists
-    js_file = 'static/js/enhanced-location.js'
-    if os.path.exists(js_file):
+    if 'enhanced-location.js' in js_names:
         print("✓ Enhanced location JavaScript exists")
     else:
         print("✗ Enhanced location JavaScript missing")
         return False
 
     # Check if templates are updated
-    home_template = 'templates/home.html'
-    if os.path.exists(home_template):
-        with open(home_template, 'r') as f:
-            content = f.read()
-            if 'enhanced-location.js' in content:
-                print("✓ Home template includes enhanced location script")
-            else:
-                print("✗ Home template not updated with enhanced location script")
-                return False
+    if 'home.html' in template_names:
+        if _file_contains('templates/home.html', b'enhanced-location.js'):
+            print("✓ Home template includes enhanced location script")
+        else:
+            print("✗ Home template not updated with enhanced location script")
+            return False
 
     # Check if demo template exists
-    demo_template = 'templates/location_demo.html'
-    if os.path.exists(demo_template):
+    if 'location_demo.html' in template_names:
         print("✓ Location demo template exists")
     else:
         print("✗ Location demo template missing")
         return False
 
     # Check if routes are updated
-    routes_file = 'routes.py'
-    if os.path.exists(routes_file):
-        with open(routes_file, 'r') as f:
-            content = f.read()
-            if '/api/location/test' in content and 'enhanced_location_service' in content:
-                print("✓ Routes updated with enhanced location endpoints")
-            else:
-                print("✗ Routes not properly updated")
-                return False
+    if 'routes.py' in root_names:
+        if _file_contains('routes.py', b'/api/location/test', b'enhanced_location_service'):
+            print("✓ Routes updated with enhanced location endpoints")
+        else:
+            print("✗ Routes not properly updated")
+            return False
 
     print("\n=== Configuration Summary ===")
     print("✓ All components configured correctly!")